@@ -17,6 +17,9 @@ logger = structlog.get_logger(__name__)
 
 T = TypeVar("T")
 
+# Clock for entry ages; monotonic so TTLs are unaffected by wall clock changes
+_now = time.monotonic
+
 
 class CacheStats:
     """Statistics for cache performance."""
@@ -63,7 +66,7 @@ class CacheEntry:
     
     def __init__(self, value: Any, ttl: int) -> None:
         self.value = value
-        self.created_at = time.time()
+        self.created_at = _now()
         self.ttl = ttl
         self.access_count = 0
         self.last_accessed = self.created_at
@@ -71,18 +74,21 @@ class CacheEntry:
     @property
     def is_expired(self) -> bool:
         """Check if the entry has expired."""
-        return time.time() - self.created_at > self.ttl
+        return _now() - self.created_at > self.ttl
     
     def access(self) -> Any:
         """Access the cached value and update metadata."""
         self.access_count += 1
-        self.last_accessed = time.time()
+        self.last_accessed = _now()
         return self.value
 
 
 class Cache:
     """LRU cache with TTL support."""
     
+    # Size of the parameter hash in keys, which carry it hex encoded
+    KEY_BYTES = hashlib.md5().digest_size
+    
     def __init__(self, config: CacheConfig) -> None:
         """Initialize cache with configuration.
         
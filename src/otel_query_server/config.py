@@ -116,6 +116,10 @@ class ServerConfig(BaseModel):
     )
     log_level: str = Field(default="INFO", description="Logging level")
     max_concurrent_requests: int = Field(default=10, description="Maximum concurrent requests")
+    use_uvloop: bool = Field(
+        default=True,
+        description="Use uvloop (winloop on Windows) as the event loop when installed"
+    )
 
 
 class BackendsConfig(BaseModel):
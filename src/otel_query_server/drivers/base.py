@@ -4,7 +4,7 @@ import asyncio
 from abc import ABC, abstractmethod
 from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Any, AsyncContextManager, Dict, List, Optional, Type, TypeVar
+from typing import Any, AsyncContextManager, Dict, List, Optional, Tuple, Type, TypeVar
 
 import structlog
 from pydantic import BaseModel, Field
@@ -57,14 +57,18 @@ class RetryableError(BackendError):
 class BaseDriver(ABC):
     """Abstract base class for backend drivers."""
     
-    def __init__(self, config: BackendConfig) -> None:
+    def __init__(self, config: BackendConfig, logger: Optional[Any] = None) -> None:
         """Initialize the driver with configuration.
         
         Args:
             config: Backend-specific configuration
+            logger: Logger to use instead of the module logger bound to the
+                driver class name
         """
         self.config = config
-        self.logger = logger.bind(driver=self.__class__.__name__)
+        if logger is None:
+            logger = structlog.get_logger(__name__).bind(driver=self.__class__.__name__)
+        self.logger = logger
         self._connected = False
         self._lock = asyncio.Lock()
     
@@ -107,6 +111,17 @@ class BaseDriver(ABC):
             except Exception as e:
                 self.logger.error("Error closing driver", error=str(e))
     
+    async def warmup(self) -> None:  # noqa: B027 - optional hook, most drivers need none
+        """Warm up the backend connection after initialization.
+        
+        Called once by the server after all drivers are initialized so that
+        connection pools, DNS resolution and authentication are paid for at
+        startup rather than by the first query. The default implementation
+        does nothing; drivers whose connections are opened lazily should
+        override it with a lightweight request.
+        """
+        pass
+    
     @asynccontextmanager
     async def ensure_connected(self) -> AsyncContextManager[None]:
         """Context manager to ensure driver is connected."""
@@ -340,6 +355,9 @@ class DriverRegistry:
     
     _drivers: Dict[str, DriverInfo] = {}
     
+    # Cached driver names, reset whenever the registry changes
+    _names: Optional[Tuple[str, ...]] = None
+    
     @classmethod
     def register(
         cls, 
@@ -366,6 +384,7 @@ class DriverRegistry:
         
         # Store driver info
         cls._drivers[name] = DriverInfo(driver_class, metadata)
+        cls._names = None
         
         logger.info(
             "Registered driver",
@@ -388,8 +407,15 @@ class DriverRegistry:
             raise KeyError(f"Driver '{name}' not registered")
         
         del cls._drivers[name]
+        cls._names = None
         logger.info("Unregistered driver", name=name)
     
+    @classmethod
+    def clear(cls) -> None:
+        """Unregister all drivers."""
+        cls._drivers.clear()
+        cls._names = None
+    
     @classmethod
     def get(cls, name: str) -> Type[BaseDriver]:
         """Get a driver class by name.
@@ -431,7 +457,9 @@ class DriverRegistry:
         Returns:
             List of driver names
         """
-        return list(cls._drivers.keys())
+        if cls._names is None:
+            cls._names = tuple(cls._drivers)
+        return list(cls._names)
     
     @classmethod
     def list_with_info(cls) -> Dict[str, DriverMetadata]:
@@ -48,11 +48,22 @@ class ElasticCloudDriver(BaseDriver):
     AUTHOR = "OTEL Query Server Team"
     SUPPORTED_BACKENDS = ["Elasticsearch", "Elastic APM", "Elastic Cloud"]
     
-    def __init__(self, config: ElasticCloudConfig) -> None:
-        """Initialize the Elastic Cloud driver."""
+    def __init__(
+        self,
+        config: ElasticCloudConfig,
+        client: Optional[AsyncElasticsearch] = None
+    ) -> None:
+        """Initialize the Elastic Cloud driver.
+        
+        Args:
+            config: Elastic Cloud configuration
+            client: Existing client to share instead of creating one. A shared
+                client is not closed when the driver disconnects.
+        """
         super().__init__(config)
         self.config: ElasticCloudConfig = config
-        self.client: Optional[AsyncElasticsearch] = None
+        self.client: Optional[AsyncElasticsearch] = client
+        self._owns_client = client is None
         
     async def _connect(self) -> None:
         """Connect to Elastic Cloud."""
@@ -81,8 +92,9 @@ class ElasticCloudDriver(BaseDriver):
             if hasattr(self.config, "ca_certs") and self.config.ca_certs:
                 kwargs["ca_certs"] = self.config.ca_certs
             
-            # Create client
-            self.client = AsyncElasticsearch(**kwargs)
+            # Create client, unless one was provided
+            if self.client is None:
+                self.client = AsyncElasticsearch(**kwargs)
             
             # Test connection
             info = await self.client.info()
@@ -101,7 +113,7 @@ class ElasticCloudDriver(BaseDriver):
     
     async def _disconnect(self) -> None:
         """Disconnect from Elastic Cloud."""
-        if self.client:
+        if self.client and self._owns_client:
             await self.client.close()
             self.client = None
     
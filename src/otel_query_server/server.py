@@ -4,7 +4,8 @@ import asyncio
 import os
 import signal
 import sys
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
 
 import structlog
 from fastmcp import FastMCP
@@ -15,25 +16,31 @@ from otel_query_server.cache import init_cache
 from otel_query_server.config import Config, get_config, load_config, set_config
 from otel_query_server.drivers.base import BaseDriver, DriverRegistry
 
-# Configure structured logging
-structlog.configure(
-    processors=[
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.format_exc_info,
-        structlog.dev.ConsoleRenderer()
-    ],
-    context_class=dict,
-    logger_factory=structlog.stdlib.LoggerFactory(),
-    cache_logger_on_first_use=True,
-)
+# Configure structured logging, unless the embedding application already did
+if not structlog.is_configured():
+    structlog.configure(
+        processors=[
+            structlog.stdlib.filter_by_level,
+            structlog.stdlib.add_logger_name,
+            structlog.stdlib.add_log_level,
+            structlog.stdlib.PositionalArgumentsFormatter(),
+            structlog.processors.TimeStamper(fmt="iso"),
+            structlog.processors.StackInfoRenderer(),
+            structlog.processors.format_exc_info,
+            structlog.dev.ConsoleRenderer()
+        ],
+        context_class=dict,
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        cache_logger_on_first_use=True,
+    )
 
 logger = structlog.get_logger(__name__)
 
+T = TypeVar("T")
+
+# Loggers bound to a server name, shared by servers with the same name
+_BOUND_LOGGERS: Dict[str, Any] = {}
+
 
 class OTelQueryServer:
     """OpenTelemetry Query Server MCP implementation."""
@@ -44,8 +51,12 @@ class OTelQueryServer:
         Args:
             config: Server configuration
         """
-        self.config = config or get_config()
-        set_config(self.config)
+        if config is None:
+            # Already the global configuration, no need to set it again
+            self.config = get_config()
+        else:
+            self.config = config
+            set_config(self.config)
         
         # Initialize FastMCP
         self.mcp = FastMCP(
@@ -59,14 +70,20 @@ class OTelQueryServer:
         # Initialize drivers
         self.drivers: Dict[str, BaseDriver] = {}
         
+        # Backend queries currently running, shared by identical concurrent calls
+        self._inflight: Dict[Tuple[Any, ...], asyncio.Future] = {}
+        
         # Store server info
-        self.server_info = {
+        self.server_info = MappingProxyType({
             "name": self.config.server.name,
             "version": self.config.server.version,
             "description": self.config.server.description,
-        }
+        })
         
-        self.logger = logger.bind(server=self.config.server.name)
+        server_name = self.config.server.name
+        self.logger = _BOUND_LOGGERS.get(server_name) or _BOUND_LOGGERS.setdefault(
+            server_name, logger.bind(server=server_name)
+        )
         
         # Register server capabilities
         self._setup_server_info()
@@ -83,6 +100,29 @@ class OTelQueryServer:
             version=self.config.server.version
         )
     
+    async def _single_flight(
+        self,
+        key: Tuple[Any, ...],
+        query: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Run a backend query once for all concurrent callers with the same key.
+        
+        Args:
+            key: Tool name and arguments identifying the query
+            query: Coroutine function performing the query
+        
+        Returns:
+            Result of the query, shared by every caller waiting on the key
+        """
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(query())
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        
+        # Shield so a cancelled caller does not cancel the query for the others
+        return await asyncio.shield(future)
+    
     def _register_tools(self) -> None:
         """Register MCP tools."""
         # Tools will be registered here as they are implemented
@@ -93,22 +133,26 @@ class OTelQueryServer:
         config = self.config
         cache = self.cache
         
+        # Backends cannot be added or removed at runtime, so compute this once
+        configured_backends = MappingProxyType({
+            "otel_collector": config.backends.otel_collector is not None,
+            "grafana": config.backends.grafana is not None,
+            "elastic_cloud": config.backends.elastic_cloud is not None,
+            "opensearch": config.backends.opensearch is not None,
+        })
+        
         @self.mcp.tool()
         async def get_server_info() -> Dict[str, Any]:
             """Get information about the OpenTelemetry Query Server.
             
             Returns server name, version, enabled backends, and cache statistics.
             """
+            # Mapping proxies are not JSON serializable, hand out shallow copies
             return {
-                "server": server_info,
+                "server": dict(server_info),
                 "backends": {
                     "enabled": config.get_enabled_backends(),
-                    "configured": {
-                        "otel_collector": config.backends.otel_collector is not None,
-                        "grafana": config.backends.grafana is not None,
-                        "elastic_cloud": config.backends.elastic_cloud is not None,
-                        "opensearch": config.backends.opensearch is not None,
-                    }
+                    "configured": dict(configured_backends)
                 },
                 "cache": cache.get_stats() if cache else {"enabled": False}
             }
@@ -138,12 +182,29 @@ class OTelQueryServer:
             Returns:
                 Dictionary containing traces and metadata
             """
-            from datetime import datetime, timedelta
-            from otel_query_server.models import TraceSearchParams, TimeRange
-            
             if not drivers:
                 return {"error": "No backend drivers configured"}
             
+            key = (
+                "search_traces", service_name, operation_name, min_duration_ms,
+                error_only, time_range_minutes, limit
+            )
+            return await self._single_flight(key, lambda: _search_traces(
+                service_name, operation_name, min_duration_ms,
+                error_only, time_range_minutes, limit
+            ))
+        
+        async def _search_traces(
+            service_name: Optional[str],
+            operation_name: Optional[str],
+            min_duration_ms: Optional[int],
+            error_only: bool,
+            time_range_minutes: int,
+            limit: int
+        ) -> Dict[str, Any]:
+            from datetime import datetime, timedelta
+            from otel_query_server.models import TraceSearchParams, TimeRange
+            
             # Build search parameters
             now = datetime.utcnow()
             params = TraceSearchParams(
@@ -195,12 +256,25 @@ class OTelQueryServer:
             Returns:
                 Dictionary containing logs and metadata
             """
-            from datetime import datetime, timedelta
-            from otel_query_server.models import LogSearchParams, TimeRange
-            
             if not drivers:
                 return {"error": "No backend drivers configured"}
             
+            key = ("search_logs", service_name, level, query, trace_id, time_range_minutes, limit)
+            return await self._single_flight(key, lambda: _search_logs(
+                service_name, level, query, trace_id, time_range_minutes, limit
+            ))
+        
+        async def _search_logs(
+            service_name: Optional[str],
+            level: Optional[str],
+            query: Optional[str],
+            trace_id: Optional[str],
+            time_range_minutes: int,
+            limit: int
+        ) -> Dict[str, Any]:
+            from datetime import datetime, timedelta
+            from otel_query_server.models import LogSearchParams, TimeRange
+            
             # Build search parameters
             now = datetime.utcnow()
             params = LogSearchParams(
@@ -243,6 +317,10 @@ class OTelQueryServer:
             if not drivers:
                 return {"error": "No backend drivers configured"}
             
+            key = ("get_service_health", service_name)
+            return await self._single_flight(key, lambda: _get_service_health(service_name))
+        
+        async def _get_service_health(service_name: str) -> Dict[str, Any]:
             # Get health from the first available driver
             for driver_name, driver in drivers.items():
                 try:
@@ -336,6 +414,20 @@ class OTelQueryServer:
         
         if not self.drivers:
             self.logger.warning("No backend drivers initialized")
+        else:
+            await self.warmup_drivers()
+    
+    async def warmup_drivers(self) -> None:
+        """Warm up backend connections of all initialized drivers."""
+        names = list(self.drivers)
+        results = await asyncio.gather(
+            *(driver.warmup() for driver in self.drivers.values()),
+            return_exceptions=True
+        )
+        
+        for name, result in zip(names, results):
+            if isinstance(result, Exception):
+                self.logger.warning("Failed to warm up driver", driver=name, error=str(result))
     
     async def close_drivers(self) -> None:
         """Close all backend drivers."""
@@ -368,16 +460,47 @@ class OTelQueryServer:
         self.logger.info("Server stopped")
 
 
-async def main(config_path: Optional[str] = None) -> None:
+def install_event_loop_policy(config: Config) -> bool:
+    """Install uvloop (winloop on Windows) as the asyncio event loop policy.
+    
+    Must be called before the event loop is created, i.e. before
+    ``asyncio.run``. Falls back to the default loop when the package
+    is not installed or the feature is disabled in configuration.
+    
+    Args:
+        config: Server configuration
+    
+    Returns:
+        True if the alternative event loop policy was installed
+    """
+    if not config.server.use_uvloop:
+        return False
+    
+    try:
+        if sys.platform == "win32":
+            import winloop as loop_impl
+        else:
+            import uvloop as loop_impl
+    except ImportError:
+        logger.debug("uvloop not installed, using default event loop")
+        return False
+    
+    asyncio.set_event_loop_policy(loop_impl.EventLoopPolicy())
+    logger.info("Installed event loop policy", policy=loop_impl.__name__)
+    return True
+
+
+async def main(config_path: Optional[str] = None, config: Optional[Config] = None) -> None:
     """Main entry point for the server.
     
     Args:
         config_path: Optional path to configuration file
+        config: Already loaded configuration, config_path is ignored if given
     """
     # Load configuration
-    config = None
     try:
-        config = load_config(config_path)
+        if config is None:
+            config = load_config(config_path)
         config.validate_backends()
     except Exception as e:
         logger.error("Failed to load configuration", error=str(e))
@@ -426,6 +549,9 @@ def create_mcp() -> FastMCP:
     config_path = os.environ.get('OTEL_QUERY_CONFIG_FILE')
     config = load_config(config_path)
     
+    # Select the event loop implementation before FastMCP starts its loop
+    install_event_loop_policy(config)
+    
     # Create server instance
     _server_instance = OTelQueryServer(config)
     
@@ -462,4 +588,12 @@ if __name__ == "__main__":
     print("Consider using: fastmcp run otel_query_server.server:create_mcp")
     print()
     
-    asyncio.run(main(args.config)) 
\ No newline at end of file
+    try:
+        config = load_config(args.config)
+    except Exception as e:
+        logger.error("Failed to load configuration", error=str(e))
+        sys.exit(1)
+    
+    # The event loop policy must be installed before asyncio.run creates the loop
+    install_event_loop_policy(config)
+    asyncio.run(main(config=config)) 
\ No newline at end of file
@@ -2,7 +2,6 @@
 """Test the improved driver registry functionality."""
 
 import sys
-sys.path.insert(0, 'src')
 
 from otel_query_server.drivers import DriverRegistry
 
@@ -23,17 +22,24 @@ def test_driver_registry():
     print("\n📊 Driver Details:")
     drivers_info = DriverRegistry.list_with_info()
     
+    # Format everything first and write it out in one go
+    sections = []
     for name, metadata in drivers_info.items():
-        print(f"\n   {name}:")
-        print(f"      Display Name: {metadata.display_name}")
-        print(f"      Description: {metadata.description}")
-        print(f"      Version: {metadata.version}")
-        print(f"      Author: {metadata.author}")
-        print(f"      Supported Backends: {', '.join(metadata.supported_backends)}")
-        print(f"      Capabilities:")
-        for cap, enabled in metadata.capabilities.items():
-            status = "✅" if enabled else "❌"
-            print(f"         - {cap}: {status}")
+        capabilities = "\n".join(
+            f"         - {cap}: {'✅' if enabled else '❌'}"
+            for cap, enabled in metadata.capabilities.items()
+        )
+        sections.append(
+            f"\n   {name}:\n"
+            f"      Display Name: {metadata.display_name}\n"
+            f"      Description: {metadata.description}\n"
+            f"      Version: {metadata.version}\n"
+            f"      Author: {metadata.author}\n"
+            f"      Supported Backends: {', '.join(metadata.supported_backends)}\n"
+            f"      Capabilities:\n"
+            f"{capabilities}\n"
+        )
+    sys.stdout.write("".join(sections))
     
     # Test getting a specific driver
     print("\n🔍 Testing Driver Retrieval:")
@@ -2,19 +2,22 @@
 
 import asyncio
 import os
-from datetime import datetime, timezone
+import sys
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, Generator
+from typing import Any, Callable, Dict, Generator, Iterator, List, Tuple
 
 import pytest
 import pytest_asyncio
 from pydantic import BaseModel
 
+from otel_query_server import models
 from otel_query_server.cache import Cache
 from otel_query_server.config import (
     BackendsConfig,
     CacheConfig,
     Config,
+    ElasticCloudConfig,
     OTELCollectorConfig,
     ServerConfig,
 )
@@ -30,8 +33,23 @@ from otel_query_server.models import (
     SpanStatus,
     TimeRange,
     Trace,
+    TraceSearchResponse,
     TraceStatus,
 )
+from tests.fixtures.backend_responses import BackendResponseFixtures
+from tests.utils import get_es_client, get_ssl_context
+
+
+def pytest_configure(config):
+    """Pay one-off import, schema and CA bundle parsing costs before any test runs."""
+    import elasticsearch  # noqa: F401
+    
+    # Schemas are normally built at import; this only completes deferred ones
+    for model in vars(models).values():
+        if isinstance(model, type) and issubclass(model, BaseModel) and model.__module__ == models.__name__:
+            model.model_rebuild()
+    
+    get_ssl_context()
 
 
 # Configure asyncio for testing
@@ -41,9 +59,9 @@ def event_loop_policy():
     return asyncio.DefaultEventLoopPolicy()
 
 
-@pytest.fixture
-def test_config() -> Config:
-    """Create a test configuration."""
+@pytest.fixture(scope="session")
+def _base_config() -> Config:
+    """Create the test configuration once per session (do not mutate)."""
     return Config(
         server=ServerConfig(
             name="test-server",
@@ -70,25 +88,98 @@ def test_config() -> Config:
 
 
 @pytest.fixture
-def test_cache(test_config: Config) -> Cache:
-    """Create a test cache instance."""
-    return Cache(test_config.cache)
+def test_config(_base_config: Config) -> Config:
+    """Create a test configuration that the test may modify."""
+    return _base_config.model_copy(deep=True)
+
+
+@pytest.fixture(scope="session")
+def elastic_settings() -> Tuple[str, str, bool]:
+    """Connection settings for a live Elasticsearch cluster.
+    
+    Skips the requesting test unless ELASTIC_URL and ELASTIC_API_KEY are set.
+    Certificate verification can be disabled with ELASTIC_VERIFY_CERTS=false.
+    """
+    url = os.getenv("ELASTIC_URL")
+    api_key = os.getenv("ELASTIC_API_KEY")
+    if not url or not api_key:
+        pytest.skip("ELASTIC_URL and ELASTIC_API_KEY must be set")
+    
+    verify = os.getenv("ELASTIC_VERIFY_CERTS", "true").lower() != "false"
+    return url, api_key, verify
+
+
+@pytest.fixture(scope="session")
+def es_client(elastic_settings: Tuple[str, str, bool]):
+    """Create an Elasticsearch client shared by all tests in the session."""
+    es = get_es_client(*elastic_settings)
+    yield es
+    es.close()
+    get_es_client.cache_clear()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def elastic_driver(elastic_settings: Tuple[str, str, bool], async_test_timeout: float):
+    """Create an Elastic Cloud driver shared by all tests in the session.
+    
+    Tests using it must run in the session event loop, e.g. with
+    ``pytest.mark.asyncio(loop_scope="session")``.
+    """
+    pytest.importorskip("aiohttp")
+    from otel_query_server.drivers.elastic_cloud import ElasticCloudDriver
+    
+    url, api_key, verify = elastic_settings
+    client = get_es_client(url, api_key, verify, asynchronous=True)
+    driver = ElasticCloudDriver(
+        ElasticCloudConfig(elasticsearch_url=url, api_key=api_key),
+        client=client
+    )
+    await asyncio.wait_for(driver.initialize(), async_test_timeout)
+    yield driver
+    await driver.close()
+    await client.close()
+    get_es_client.cache_clear()
 
 
 @pytest.fixture
-def sample_time_range() -> TimeRange:
-    """Create a sample time range."""
-    now = datetime.now(timezone.utc)
+def report(request) -> Iterator[Callable[[str], None]]:
+    """Collect diagnostic lines and write them out in one go.
+    
+    Output is only produced when pytest runs with -v (which offsets the
+    -q from the project's addopts).
+    """
+    lines: List[str] = []
+    yield lines.append
+    
+    if lines and request.config.getoption("verbose") >= 0:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
+
+@pytest.fixture
+def test_cache(_base_config: Config) -> Cache:
+    """Create a test cache instance."""
+    return Cache(_base_config.cache)
+
+
+@pytest.fixture(scope="session")
+def _now() -> datetime:
+    """Reference time shared by all sample fixtures in the session."""
+    return datetime.now(timezone.utc)
+
+
+@pytest.fixture(scope="session")
+def sample_time_range(_now: datetime) -> TimeRange:
+    """Create a sample time range, shared by the session (do not mutate)."""
     return TimeRange(
-        start=now.replace(hour=0, minute=0, second=0, microsecond=0),
-        end=now,
+        start=_now.replace(hour=0, minute=0, second=0, microsecond=0),
+        end=_now,
     )
 
 
 @pytest.fixture
-def sample_span() -> Span:
+def sample_span(_now: datetime) -> Span:
     """Create a sample span."""
-    now = datetime.now(timezone.utc)
     return Span(
         trace_id="trace123",
         span_id="span456",
@@ -96,8 +187,8 @@ def sample_span() -> Span:
         operation_name="test-operation",
         service_name="test-service",
         kind=SpanKind.SERVER,
-        start_time=now,
-        end_time=now,
+        start_time=_now,
+        end_time=_now + timedelta(milliseconds=1),
         duration_ns=1000000,  # 1ms
         status=SpanStatus(code=TraceStatus.OK),
         attributes={"http.method": "GET", "http.status_code": 200},
@@ -111,10 +202,10 @@ def sample_trace(sample_span: Span) -> Trace:
 
 
 @pytest.fixture
-def sample_log_entry() -> LogEntry:
+def sample_log_entry(_now: datetime) -> LogEntry:
     """Create a sample log entry."""
     return LogEntry(
-        timestamp=datetime.now(timezone.utc),
+        timestamp=_now,
         level=LogLevel.INFO,
         message="Test log message",
         service_name="test-service",
@@ -125,9 +216,8 @@ def sample_log_entry() -> LogEntry:
 
 
 @pytest.fixture
-def sample_metric() -> Metric:
+def sample_metric(_now: datetime) -> Metric:
     """Create a sample metric."""
-    now = datetime.now(timezone.utc)
     return Metric(
         name="test_metric",
         type=MetricType.GAUGE,
@@ -136,7 +226,7 @@ def sample_metric() -> Metric:
         service_name="test-service",
         data_points=[
             MetricDataPoint(
-                timestamp=now,
+                timestamp=_now,
                 value=42.0,
                 labels={"env": "test"},
             )
@@ -145,7 +235,7 @@ def sample_metric() -> Metric:
 
 
 @pytest.fixture
-def sample_service_health() -> ServiceHealth:
+def sample_service_health(_now: datetime) -> ServiceHealth:
     """Create a sample service health."""
     return ServiceHealth(
         service_name="test-service",
@@ -154,77 +244,77 @@ def sample_service_health() -> ServiceHealth:
         error_rate=0.01,
         latency_p99_ms=100.0,
         request_rate=50.0,
-        last_seen=datetime.now(timezone.utc),
+        last_seen=_now,
         attributes={"version": "1.0.0"},
     )
 
 
 # Test data generators
+_OK_STATUS = SpanStatus(code=TraceStatus.OK)
+_LEVELS = list(LogLevel)
+_STEP = timedelta(milliseconds=1)
+
+
 def generate_spans(count: int, trace_id: str = "trace123") -> list[Span]:
     """Generate multiple spans for testing."""
-    spans = []
+    spans: list[Span] = [None] * count
     base_time = datetime.now(timezone.utc)
     
     for i in range(count):
-        span = Span(
+        start_time = base_time + _STEP * i
+        spans[i] = Span(
             trace_id=trace_id,
             span_id=f"span{i}",
             parent_span_id=f"span{i-1}" if i > 0 else None,
             operation_name=f"operation-{i}",
             service_name=f"service-{i % 3}",  # Rotate between 3 services
             kind=SpanKind.SERVER if i % 2 == 0 else SpanKind.CLIENT,
-            start_time=base_time,
-            end_time=base_time,
+            start_time=start_time,
+            end_time=start_time,
             duration_ns=1000000 * (i + 1),  # Variable duration
-            status=SpanStatus(code=TraceStatus.OK),
+            status=_OK_STATUS,
             attributes={"index": i},
         )
-        spans.append(span)
-        base_time = base_time.replace(microsecond=base_time.microsecond + 1000)
     
     return spans
 
 
 def generate_logs(count: int) -> list[LogEntry]:
     """Generate multiple log entries for testing."""
-    logs = []
+    logs: list[LogEntry] = [None] * count
     base_time = datetime.now(timezone.utc)
-    levels = list(LogLevel)
     
     for i in range(count):
-        log = LogEntry(
-            timestamp=base_time,
-            level=levels[i % len(levels)],
+        logs[i] = LogEntry(
+            timestamp=base_time + _STEP * i,
+            level=_LEVELS[i % len(_LEVELS)],
             message=f"Log message {i}",
             service_name=f"service-{i % 3}",
             trace_id=f"trace{i % 5}" if i % 2 == 0 else None,
             span_id=f"span{i}" if i % 2 == 0 else None,
             attributes={"index": i},
         )
-        logs.append(log)
-        base_time = base_time.replace(microsecond=base_time.microsecond + 1000)
     
     return logs
 
 
 def generate_metrics(count: int) -> list[Metric]:
     """Generate multiple metrics for testing."""
-    metrics = []
+    metrics: list[Metric] = [None] * count
     base_time = datetime.now(timezone.utc)
+    second = timedelta(seconds=1)
     
     for i in range(count):
-        data_points = []
-        for j in range(5):  # 5 data points per metric
-            data_points.append(
-                MetricDataPoint(
-                    timestamp=base_time,
-                    value=float(i * 10 + j),
-                    labels={"env": "test", "index": str(i)},
-                )
+        data_points = [
+            MetricDataPoint(
+                timestamp=base_time + second * (i * 5 + j),
+                value=float(i * 10 + j),
+                labels={"env": "test", "index": str(i)},
             )
-            base_time = base_time.replace(second=base_time.second + 1)
+            for j in range(5)  # 5 data points per metric
+        ]
         
-        metric = Metric(
+        metrics[i] = Metric(
             name=f"metric_{i}",
             type=MetricType.GAUGE if i % 2 == 0 else MetricType.COUNTER,
             unit="units",
@@ -232,48 +322,72 @@ def generate_metrics(count: int) -> list[Metric]:
             service_name=f"service-{i % 3}",
             data_points=data_points,
         )
-        metrics.append(metric)
     
     return metrics
 
 
-# Mock data fixtures
-@pytest.fixture
+# Mock data fixtures, built once per session and shared (do not mutate)
+@pytest.fixture(scope="session")
 def mock_traces() -> list[Trace]:
     """Create mock traces for testing."""
-    traces = []
-    for i in range(5):
-        spans = generate_spans(3, trace_id=f"trace{i}")
-        trace = Trace.from_spans(f"trace{i}", spans)
-        traces.append(trace)
-    return traces
+    return [
+        Trace.from_spans(f"trace{i}", generate_spans(3, trace_id=f"trace{i}"))
+        for i in range(5)
+    ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_logs() -> list[LogEntry]:
     """Create mock logs for testing."""
     return generate_logs(20)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_metrics() -> list[Metric]:
     """Create mock metrics for testing."""
     return generate_metrics(10)
 
 
-# Async test helpers
+@pytest.fixture(scope="session")
+def _trace_response_json() -> bytes:
+    """Serialize a large mock trace search response once per session."""
+    return BackendResponseFixtures.create_trace_response(50).model_dump_json().encode()
+
+
 @pytest.fixture
-async def async_test_timeout():
+def big_trace_response(_trace_response_json: bytes) -> TraceSearchResponse:
+    """Create a fresh trace search response with 50 traces.
+    
+    Parsing the serialized response is faster than building it, and each
+    test gets its own instance that it may mutate.
+    """
+    return TraceSearchResponse.model_validate_json(_trace_response_json)
+
+
+# Async test helpers
+@pytest.fixture(scope="session")
+def async_test_timeout() -> float:
     """Provide a timeout for async tests."""
     return 5.0  # 5 seconds
 
 
 # Environment setup
-@pytest.fixture(autouse=True)
-def setup_test_env(monkeypatch):
-    """Set up test environment variables."""
+@pytest.fixture(scope="session", autouse=True)
+def setup_test_env() -> Generator[None, None, None]:
+    """Mark the process as running tests for the whole session."""
+    old = os.environ.get("OTEL_QUERY_TEST_MODE")
+    os.environ["OTEL_QUERY_TEST_MODE"] = "true"
+    yield
+    if old is None:
+        del os.environ["OTEL_QUERY_TEST_MODE"]
+    else:
+        os.environ["OTEL_QUERY_TEST_MODE"] = old
+
+
+@pytest.fixture
+def debug_logging(monkeypatch) -> None:
+    """Configure DEBUG server logging through the environment."""
     monkeypatch.setenv("OTEL_QUERY_SERVER__LOG_LEVEL", "DEBUG")
-    monkeypatch.setenv("OTEL_QUERY_TEST_MODE", "true")
 
 
 # Temporary directory fixtures
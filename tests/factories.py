@@ -0,0 +1,44 @@
+"""Factories for model instances used by tests.
+
+The factories build models with model_construct, which skips validation.
+Use them in tests that don't exercise validation; tests that expect a
+ValidationError must call the model constructors directly.
+"""
+
+from datetime import datetime, timedelta, timezone
+from functools import cache
+from typing import List
+
+from otel_query_server.models import Span, TimeRange, Trace
+
+# Fixed reference time for test data, so cached responses and expected values
+# do not depend on when the tests run
+BASE_TIME = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+@cache
+def default_time_range() -> TimeRange:
+    """The hour before BASE_TIME, shared by all callers (do not mutate)."""
+    return TimeRange.model_construct(start=BASE_TIME - timedelta(hours=1), end=BASE_TIME)
+
+
+def trace_from_spans(trace_id: str, spans: List[Span]) -> Trace:
+    """Create a trace from spans like Trace.from_spans, without validation.
+    
+    Args:
+        trace_id: Trace ID
+        spans: Spans of the trace
+    
+    Returns:
+        Trace with fields derived from the spans
+    """
+    start_time = min(span.start_time for span in spans)
+    end_time = max(span.end_time for span in spans)
+    return Trace.model_construct(
+        trace_id=trace_id,
+        spans=spans,
+        start_time=start_time,
+        end_time=end_time,
+        duration_ms=(end_time - start_time).total_seconds() * 1000,
+        service_names=list(set(span.service_name for span in spans))
+    )
@@ -1,7 +1,11 @@
 """Mock backend response fixtures."""
 
-from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List
+from datetime import timedelta
+from functools import cache
+from itertools import cycle
+from typing import Any, Dict, List, Tuple
+
+from pydantic import TypeAdapter
 
 from otel_query_server.models import (
     LogEntry,
@@ -15,257 +19,377 @@ from otel_query_server.models import (
     Span,
     SpanKind,
     SpanStatus,
-    Trace,
     TraceSearchResponse,
     TraceStatus,
 )
+from tests.factories import BASE_TIME, trace_from_spans
 
+# The inputs below are hand-crafted and known to be valid, so models are built
+# with model_construct and per-item variants with model_copy(update=...), both
+# of which skip validation. Only safe in fixtures: test_models.py validates the
+# generated responses against the real models to catch schema drift.
+# Unchanging attributes are shared by all copies of a template.
+_OK_STATUS = SpanStatus.model_construct(code=TraceStatus.OK)
+_ERROR_STATUS = SpanStatus.model_construct(code=TraceStatus.ERROR)
 
-class BackendResponseFixtures:
-    """Fixtures for mock backend responses."""
+# Span offsets from the start of a trace
+_MS_5 = timedelta(milliseconds=5)
+_MS_15 = timedelta(milliseconds=15)
+_MS_20 = timedelta(milliseconds=20)
+_MS_120 = timedelta(milliseconds=120)
+_MS_150 = timedelta(milliseconds=150)
+
+# Per-trace values indexed by i % 3: every third trace fails
+_TRACE_OUTCOMES = ((_ERROR_STATUS, 500), (_OK_STATUS, 200), (_OK_STATUS, 200))
+# Indexed by i % 2
+_CACHE_HITS = (True, False)
+
+_ROOT_SPAN = Span.model_construct(
+    trace_id="",
+    span_id="",
+    parent_span_id=None,
+    operation_name="HTTP GET /api/endpoint",
+    service_name="frontend",
+    kind=SpanKind.SERVER,
+    start_time=BASE_TIME,
+    end_time=BASE_TIME + _MS_150,
+    duration_ns=150_000_000,
+    status=_OK_STATUS,
+)
+
+_DB_SPAN = Span.model_construct(
+    trace_id="",
+    span_id="",
+    parent_span_id="",
+    operation_name="SELECT FROM users",
+    service_name="database",
+    kind=SpanKind.CLIENT,
+    start_time=BASE_TIME,
+    end_time=BASE_TIME + timedelta(milliseconds=100),
+    duration_ns=100_000_000,
+    status=_OK_STATUS,
+    attributes={
+        "db.type": "postgresql",
+        "db.statement": "SELECT * FROM users WHERE id = ?",
+        "db.rows_affected": 1,
+    }
+)
+
+_CACHE_SPAN = Span.model_construct(
+    trace_id="",
+    span_id="",
+    parent_span_id="",
+    operation_name="cache.get",
+    service_name="cache",
+    kind=SpanKind.CLIENT,
+    start_time=BASE_TIME,
+    end_time=BASE_TIME + timedelta(milliseconds=10),
+    duration_ns=10_000_000,
+    status=_OK_STATUS,
+)
+
+_SERVICES = ("frontend", "backend", "database", "cache")
+_PERCENTILES = ("p50", "p95", "p99")
+_BASE_VALUE = {"p50": 50, "p95": 200, "p99": 500}
+
+# Per-series value offsets, looked up instead of hashed inside the loops
+_SERVICE_HASH = {service: hash(service) % 50 for service in _SERVICES}
+_SVC_PCT_HASH = {
+    (service, percentile): hash(f"{service}{percentile}") % 20
+    for service in _SERVICES
+    for percentile in _PERCENTILES
+}
+
+# Hourly timestamps covering the last 24 hours, shared by all metric series
+_HOURS = tuple(BASE_TIME - timedelta(hours=23 - i) for i in range(24))
+
+# Hourly error rate values, 1-2%
+_ERROR_RATE_VALUES = tuple(0.01 + (0.001 * (i % 10)) for i in range(len(_HOURS)))
+
+# Validates a whole series in one call instead of building points one by one
+_DATA_POINTS_ADAPTER = TypeAdapter(List[MetricDataPoint])
+
+# Level, service, message template and error flag of a log entry, repeating every 4 entries
+_LOG_VARIANTS = (
+    (LogLevel.DEBUG, "frontend", "Log message {}: Processing request", False),
+    (LogLevel.INFO, "backend", "Log message {}: Processing request", False),
+    (LogLevel.WARN, "database", "Log message {}: Processing request", False),
+    (LogLevel.ERROR, "cache", "Error {}: Request failed", True),
+)
+
+_LOG_ENTRY = LogEntry.model_construct(
+    timestamp=BASE_TIME,
+    level=LogLevel.INFO,
+    message="",
+    service_name="",
+)
+
+
+@cache
+def _ids(i: int) -> Tuple[str, str, str, str]:
+    """Trace ID and root, database and cache span IDs of the i-th mock trace.
     
-    @staticmethod
-    def create_trace_response(count: int = 5) -> TraceSearchResponse:
-        """Create a mock trace search response."""
-        traces = []
-        base_time = datetime.now(timezone.utc)
+    Cached so traces and logs referring to the same trace share the strings.
+    """
+    span_prefix = f"span{i:04d}"
+    return f"trace{i:04d}", f"{span_prefix}-0", f"{span_prefix}-1", f"{span_prefix}-2"
+
+
+@cache
+def _series_values(offset: int, step: int) -> Tuple[float, ...]:
+    """Hourly values of a linearly growing metric series.
+    
+    Args:
+        offset: Value of the first data point
+        step: Increase per hour
+    
+    Returns:
+        One value per entry of _HOURS
+    """
+    return tuple(float(offset + i * step) for i in range(len(_HOURS)))
+
+
+def _data_points(values: Tuple[float, ...], labels: Dict[str, str]) -> List[MetricDataPoint]:
+    """Create one data point per entry of _HOURS.
+    
+    Args:
+        values: Data point values, one per hour
+        labels: Labels of the series, copied into each data point
+    
+    Returns:
+        List of data points
+    """
+    return _DATA_POINTS_ADAPTER.validate_python([
+        {"timestamp": timestamp, "value": value, "labels": labels}
+        for timestamp, value in zip(_HOURS, values)
+    ])
+
+
+@cache
+def _build_trace_response(count: int) -> TraceSearchResponse:
+    """Create a mock trace search response."""
+    traces = []
+    base_time = BASE_TIME
+    
+    for i in range(count):
+        trace_id, root_span_id, db_span_id, cache_span_id = _ids(i)
+        trace_start = base_time - timedelta(minutes=i)
+        status, status_code = _TRACE_OUTCOMES[i % 3]
         
-        for i in range(count):
-            spans = []
-            trace_start = base_time - timedelta(minutes=i)
-            
+        spans = [
             # Root span
-            root_span = Span(
-                trace_id=f"trace{i:04d}",
-                span_id=f"span{i:04d}-0",
-                parent_span_id=None,
-                operation_name="HTTP GET /api/endpoint",
-                service_name="frontend",
-                kind=SpanKind.SERVER,
-                start_time=trace_start,
-                end_time=trace_start + timedelta(milliseconds=150),
-                duration_ns=150_000_000,
-                status=SpanStatus(code=TraceStatus.OK if i % 3 != 0 else TraceStatus.ERROR),
-                attributes={
+            _ROOT_SPAN.model_copy(update={
+                "trace_id": trace_id,
+                "span_id": root_span_id,
+                "start_time": trace_start,
+                "end_time": trace_start + _MS_150,
+                "status": status,
+                "attributes": {
                     "http.method": "GET",
                     "http.url": f"/api/endpoint?id={i}",
-                    "http.status_code": 200 if i % 3 != 0 else 500,
+                    "http.status_code": status_code,
                     "user.id": f"user{i % 10}",
-                }
-            )
-            spans.append(root_span)
-            
+                },
+            }),
             # Database span
-            db_span = Span(
-                trace_id=f"trace{i:04d}",
-                span_id=f"span{i:04d}-1",
-                parent_span_id=f"span{i:04d}-0",
-                operation_name="SELECT FROM users",
-                service_name="database",
-                kind=SpanKind.CLIENT,
-                start_time=trace_start + timedelta(milliseconds=20),
-                end_time=trace_start + timedelta(milliseconds=120),
-                duration_ns=100_000_000,
-                status=SpanStatus(code=TraceStatus.OK),
-                attributes={
-                    "db.type": "postgresql",
-                    "db.statement": "SELECT * FROM users WHERE id = ?",
-                    "db.rows_affected": 1,
-                }
-            )
-            spans.append(db_span)
-            
+            _DB_SPAN.model_copy(update={
+                "trace_id": trace_id,
+                "span_id": db_span_id,
+                "parent_span_id": root_span_id,
+                "start_time": trace_start + _MS_20,
+                "end_time": trace_start + _MS_120,
+            }),
             # Cache span
-            cache_span = Span(
-                trace_id=f"trace{i:04d}",
-                span_id=f"span{i:04d}-2",
-                parent_span_id=f"span{i:04d}-0",
-                operation_name="cache.get",
-                service_name="cache",
-                kind=SpanKind.CLIENT,
-                start_time=trace_start + timedelta(milliseconds=5),
-                end_time=trace_start + timedelta(milliseconds=15),
-                duration_ns=10_000_000,
-                status=SpanStatus(code=TraceStatus.OK),
-                attributes={
+            _CACHE_SPAN.model_copy(update={
+                "trace_id": trace_id,
+                "span_id": cache_span_id,
+                "parent_span_id": root_span_id,
+                "start_time": trace_start + _MS_5,
+                "end_time": trace_start + _MS_15,
+                "attributes": {
                     "cache.type": "redis",
-                    "cache.hit": i % 2 == 0,
+                    "cache.hit": _CACHE_HITS[i % 2],
                     "cache.key": f"user:{i % 10}",
-                }
-            )
-            spans.append(cache_span)
-            
-            trace = Trace.from_spans(f"trace{i:04d}", spans)
-            traces.append(trace)
+                },
+            }),
+        ]
         
-        return TraceSearchResponse(
-            traces=traces,
-            total_count=count * 2,  # Simulate having more results
-            has_more=count < 10
-        )
+        traces.append(trace_from_spans(trace_id, spans))
     
-    @staticmethod
-    def create_log_response(count: int = 20) -> LogSearchResponse:
-        """Create a mock log search response."""
-        logs = []
-        base_time = datetime.now(timezone.utc)
-        levels = [LogLevel.DEBUG, LogLevel.INFO, LogLevel.WARN, LogLevel.ERROR]
-        services = ["frontend", "backend", "database", "cache"]
-        
-        for i in range(count):
-            log = LogEntry(
-                timestamp=base_time - timedelta(seconds=i),
-                level=levels[i % len(levels)],
-                message=f"Log message {i}: Processing request" if i % 4 != 3 else f"Error {i}: Request failed",
-                service_name=services[i % len(services)],
-                trace_id=f"trace{i:04d}" if i % 3 == 0 else None,
-                span_id=f"span{i:04d}-0" if i % 3 == 0 else None,
-                attributes={
-                    "component": services[i % len(services)],
-                    "request_id": f"req{i:04d}",
-                    "user_id": f"user{i % 10}" if i % 2 == 0 else None,
-                    "error": i % 4 == 3,
-                }
-            )
-            logs.append(log)
+    return TraceSearchResponse.model_construct(
+        traces=traces,
+        total_count=count * 2,  # Simulate having more results
+        has_more=count < 10
+    )
+
+
+@cache
+def _build_log_response(count: int) -> LogSearchResponse:
+    """Create a mock log search response."""
+    logs = []
+    base_time = BASE_TIME
+    
+    # zip stops at count, cycle rotates through the variants without modulo
+    for i, (level, service, message, error) in zip(range(count), cycle(_LOG_VARIANTS)):
+        trace_id, span_id = _ids(i)[:2] if i % 3 == 0 else (None, None)
+        log = _LOG_ENTRY.model_copy(update={
+            "timestamp": base_time - timedelta(seconds=i),
+            "level": level,
+            "message": message.format(i),
+            "service_name": service,
+            "trace_id": trace_id,
+            "span_id": span_id,
+            "attributes": {
+                "component": service,
+                "request_id": f"req{i:04d}",
+                "user_id": f"user{i % 10}" if i % 2 == 0 else None,
+                "error": error,
+            },
+        })
+        logs.append(log)
+    
+    return LogSearchResponse.model_construct(
+        logs=logs,
+        total_count=count * 5,  # Simulate having more results
+        has_more=count < 100
+    )
+
+
+@cache
+def _build_metric_response(count: int) -> MetricQueryResponse:
+    """Create a mock metric query response."""
+    metrics = []
+    services = _SERVICES
+    
+    # HTTP request rate metric
+    for service in services[:2]:  # Only frontend and backend
+        offset = 100 + _SERVICE_HASH[service]
+        labels = {
+            "service": service,
+            "environment": "production",
+            "region": "us-east-1",
+        }
+        data_points = _data_points(_series_values(offset, 10), labels)
         
-        return LogSearchResponse(
-            logs=logs,
-            total_count=count * 5,  # Simulate having more results
-            has_more=count < 100
+        metric = Metric.model_construct(
+            name="http_requests_per_minute",
+            type=MetricType.GAUGE,
+            unit="requests/min",
+            description="HTTP requests per minute",
+            service_name=service,
+            data_points=data_points
         )
+        metrics.append(metric)
     
-    @staticmethod
-    def create_metric_response(count: int = 10) -> MetricQueryResponse:
-        """Create a mock metric query response."""
-        metrics = []
-        base_time = datetime.now(timezone.utc)
-        services = ["frontend", "backend", "database", "cache"]
-        
-        # HTTP request rate metric
-        for service in services[:2]:  # Only frontend and backend
-            data_points = []
-            for i in range(24):  # 24 hours of data
-                timestamp = base_time - timedelta(hours=23-i)
-                value = 100 + (i * 10) + (hash(service) % 50)
-                data_points.append(
-                    MetricDataPoint(
-                        timestamp=timestamp,
-                        value=float(value),
-                        labels={
-                            "service": service,
-                            "environment": "production",
-                            "region": "us-east-1",
-                        }
-                    )
-                )
-            
-            metric = Metric(
-                name="http_requests_per_minute",
-                type=MetricType.GAUGE,
-                unit="requests/min",
-                description="HTTP requests per minute",
-                service_name=service,
-                data_points=data_points
-            )
-            metrics.append(metric)
+    # Error rate metric
+    for service in services:
+        labels = {
+            "service": service,
+            "environment": "production",
+        }
+        data_points = _data_points(_ERROR_RATE_VALUES, labels)
         
-        # Error rate metric
-        for service in services:
-            data_points = []
-            for i in range(24):  # 24 hours of data
-                timestamp = base_time - timedelta(hours=23-i)
-                value = 0.01 + (0.001 * (i % 10))  # 1-2% error rate
-                data_points.append(
-                    MetricDataPoint(
-                        timestamp=timestamp,
-                        value=value,
-                        labels={
-                            "service": service,
-                            "environment": "production",
-                        }
-                    )
-                )
+        metric = Metric.model_construct(
+            name="error_rate",
+            type=MetricType.GAUGE,
+            unit="ratio",
+            description="Error rate as a ratio of failed requests",
+            service_name=service,
+            data_points=data_points
+        )
+        metrics.append(metric)
+    
+    # Response time percentiles
+    for service in services[:2]:  # Only frontend and backend
+        for percentile in _PERCENTILES:
+            base_value = _BASE_VALUE[percentile] + _SVC_PCT_HASH[(service, percentile)]
+            labels = {
+                "service": service,
+                "percentile": percentile,
+                "environment": "production",
+            }
+            data_points = _data_points(_series_values(base_value, 5), labels)
             
-            metric = Metric(
-                name="error_rate",
+            metric = Metric.model_construct(
+                name="response_time_ms",
                 type=MetricType.GAUGE,
-                unit="ratio",
-                description="Error rate as a ratio of failed requests",
+                unit="milliseconds",
+                description=f"Response time {percentile}",
                 service_name=service,
                 data_points=data_points
             )
             metrics.append(metric)
-        
-        # Response time percentiles
-        percentiles = ["p50", "p95", "p99"]
-        for service in services[:2]:  # Only frontend and backend
-            for percentile in percentiles:
-                data_points = []
-                base_value = {"p50": 50, "p95": 200, "p99": 500}[percentile]
-                
-                for i in range(24):  # 24 hours of data
-                    timestamp = base_time - timedelta(hours=23-i)
-                    value = base_value + (i * 5) + (hash(f"{service}{percentile}") % 20)
-                    data_points.append(
-                        MetricDataPoint(
-                            timestamp=timestamp,
-                            value=float(value),
-                            labels={
-                                "service": service,
-                                "percentile": percentile,
-                                "environment": "production",
-                            }
-                        )
-                    )
-                
-                metric = Metric(
-                    name="response_time_ms",
-                    type=MetricType.GAUGE,
-                    unit="milliseconds",
-                    description=f"Response time {percentile}",
-                    service_name=service,
-                    data_points=data_points
-                )
-                metrics.append(metric)
-        
-        return MetricQueryResponse(
-            metrics=metrics[:count],  # Return requested number
-            total_count=len(metrics)
-        )
+    
+    return MetricQueryResponse.model_construct(
+        metrics=metrics[:count],  # Return requested number
+        total_count=len(metrics)
+    )
+
+
+@cache
+def _build_service_health_response(service_name: str) -> ServiceHealth:
+    """Create a mock service health response."""
+    # Simulate different health states based on service name
+    if "unhealthy" in service_name:
+        status = "unhealthy"
+        error_rate = 0.15  # 15% error rate
+        latency_p99 = 2000.0  # 2 seconds
+    elif "degraded" in service_name:
+        status = "degraded"
+        error_rate = 0.05  # 5% error rate
+        latency_p99 = 800.0  # 800ms
+    else:
+        status = "healthy"
+        error_rate = 0.01  # 1% error rate
+        latency_p99 = 250.0  # 250ms
+    
+    return ServiceHealth.model_construct(
+        service_name=service_name,
+        status=status,
+        uptime_seconds=86400.0 * 7,  # 7 days
+        error_rate=error_rate,
+        latency_p99_ms=latency_p99,
+        request_rate=100.0 + hash(service_name) % 500,  # 100-600 req/s
+        last_seen=BASE_TIME,
+        attributes={
+            "version": "1.2.3",
+            "deployment": "production",
+            "region": "us-east-1",
+            "instances": 3,
+        }
+    )
+
+
+class BackendResponseFixtures:
+    """Fixtures for mock backend responses.
+    
+    Responses are built once per set of arguments and shared between callers.
+    Pass ``mutable=True`` to get a deep copy that a test may modify.
+    """
     
     @staticmethod
-    def create_service_health_response(service_name: str) -> ServiceHealth:
+    def create_trace_response(count: int = 5, mutable: bool = False) -> TraceSearchResponse:
+        """Create a mock trace search response."""
+        response = _build_trace_response(count)
+        return response.model_copy(deep=True) if mutable else response
+    
+    @staticmethod
+    def create_log_response(count: int = 20, mutable: bool = False) -> LogSearchResponse:
+        """Create a mock log search response."""
+        response = _build_log_response(count)
+        return response.model_copy(deep=True) if mutable else response
+    
+    @staticmethod
+    def create_metric_response(count: int = 10, mutable: bool = False) -> MetricQueryResponse:
+        """Create a mock metric query response."""
+        response = _build_metric_response(count)
+        return response.model_copy(deep=True) if mutable else response
+    
+    @staticmethod
+    def create_service_health_response(service_name: str, mutable: bool = False) -> ServiceHealth:
         """Create a mock service health response."""
-        # Simulate different health states based on service name
-        if "unhealthy" in service_name:
-            status = "unhealthy"
-            error_rate = 0.15  # 15% error rate
-            latency_p99 = 2000.0  # 2 seconds
-        elif "degraded" in service_name:
-            status = "degraded"
-            error_rate = 0.05  # 5% error rate
-            latency_p99 = 800.0  # 800ms
-        else:
-            status = "healthy"
-            error_rate = 0.01  # 1% error rate
-            latency_p99 = 250.0  # 250ms
-        
-        return ServiceHealth(
-            service_name=service_name,
-            status=status,
-            uptime_seconds=86400.0 * 7,  # 7 days
-            error_rate=error_rate,
-            latency_p99_ms=latency_p99,
-            request_rate=100.0 + hash(service_name) % 500,  # 100-600 req/s
-            last_seen=datetime.now(timezone.utc),
-            attributes={
-                "version": "1.2.3",
-                "deployment": "production",
-                "region": "us-east-1",
-                "instances": 3,
-            }
-        )
+        response = _build_service_health_response(service_name)
+        return response.model_copy(deep=True) if mutable else response
     
     @staticmethod
     def create_error_response(error_type: str = "timeout") -> Dict[str, Any]:
@@ -314,4 +438,4 @@ class BackendResponseFixtures:
             "error": "Unknown error",
             "message": "An unknown error occurred",
             "code": "UNKNOWN_ERROR"
-        }) 
\ No newline at end of file
+        })
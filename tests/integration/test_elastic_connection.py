@@ -0,0 +1,77 @@
+"""Connection checks against a live Elastic Cloud cluster.
+
+Run before starting the OTEL Query Server to verify the cluster is reachable::
+
+    ELASTIC_URL=https://... ELASTIC_API_KEY=... pytest tests/integration -s -v
+
+The tests are skipped unless ELASTIC_URL and ELASTIC_API_KEY are set.
+"""
+
+import re
+
+import pytest
+import urllib3
+
+from tests.utils import get_ssl_context
+
+pytestmark = pytest.mark.integration
+
+# Base64 alphabet with up to two padding characters
+_B64_RE = re.compile(r"^[A-Za-z0-9+/]+={0,2}$")
+
+
+@pytest.fixture(scope="module")
+def http_pool(elastic_settings):
+    """Connection pool for raw HTTP probes, kept alive between requests."""
+    verify = elastic_settings[2]
+    pool = urllib3.PoolManager(maxsize=4, ssl_context=get_ssl_context(verify))
+    yield pool
+    pool.clear()
+
+
+def test_api_key_format(elastic_settings, report):
+    """Test that the API key looks like base64."""
+    api_key = elastic_settings[1]
+    report(f"🔑 API Key (first 20 chars): {api_key[:20]}...")
+    report(f"🔑 API Key length: {len(api_key)} characters")
+    
+    assert len(api_key) % 4 == 0 and _B64_RE.match(api_key), \
+        "API key does not appear to be valid base64"
+
+
+def test_basic_connectivity(elastic_settings, http_pool, report):
+    """Test raw HTTPS connectivity and authentication."""
+    url, api_key, _ = elastic_settings
+    report(f"🔍 Testing connection to: {url}")
+    
+    # Note: ApiKey should be sent as-is (it's already base64 encoded)
+    headers = {
+        'Authorization': f'ApiKey {api_key}',
+        'Content-Type': 'application/json'
+    }
+    try:
+        response = http_pool.request("GET", f"{url}/", headers=headers, retries=False)
+    except urllib3.exceptions.SSLError as e:
+        pytest.fail(
+            f"SSL error: {e}. If the cluster uses a self-signed certificate, "
+            "set ELASTIC_VERIFY_CERTS=false and 'verify_certs: false' in your config"
+        )
+    except urllib3.exceptions.HTTPError as e:
+        pytest.fail(f"Connection to {url} failed: {e}")
+    
+    assert response.status != 401, "Authentication failed - API key may be invalid"
+    assert response.status < 400, f"HTTP Error {response.status}: {response.reason}"
+    report(f"✅ Basic HTTPS connection successful! Status: {response.status}")
+
+
+def test_cluster_info(es_client, report):
+    """Test querying cluster information with the Elasticsearch client."""
+    info = es_client.info()
+    report(f"📊 Cluster name: {info['cluster_name']}")
+    report(f"📊 Version: {info['version']['number']}")
+    
+    assert info["cluster_name"]
+    
+    # Only fetch the index name column, the count is all we need
+    indices = es_client.cat.indices(format="json", h="index")
+    report(f"📊 Number of indices: {len(indices)}")
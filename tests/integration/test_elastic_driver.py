@@ -0,0 +1,53 @@
+"""Integration tests for the Elastic Cloud driver against a live cluster.
+
+The tests are skipped unless ELASTIC_URL and ELASTIC_API_KEY are set.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from otel_query_server.models import LogSearchParams, TimeRange, TraceSearchParams
+
+pytestmark = [pytest.mark.integration, pytest.mark.asyncio(loop_scope="session")]
+
+
+async def test_elastic_driver(elastic_driver, async_test_timeout, report):
+    """Test trace search, log search and service health against Elastic Cloud."""
+    now = datetime.now(timezone.utc)
+    trace_params = TraceSearchParams(
+        time_range=TimeRange(
+            start=now - timedelta(hours=24),
+            end=now
+        ),
+        limit=5
+    )
+    log_params = LogSearchParams(
+        time_range=TimeRange(
+            start=now - timedelta(hours=1),
+            end=now
+        ),
+        limit=10
+    )
+    
+    # The three queries are independent, so run them concurrently
+    trace_response, log_response, health = await asyncio.gather(
+        asyncio.wait_for(elastic_driver.search_traces(trace_params), async_test_timeout),
+        asyncio.wait_for(elastic_driver.search_logs(log_params), async_test_timeout),
+        # You might need to adjust this service name
+        asyncio.wait_for(elastic_driver.get_service_health("example-service"), async_test_timeout),
+        return_exceptions=True
+    )
+    
+    assert not isinstance(trace_response, Exception), f"Trace search failed: {trace_response}"
+    report(f"✅ Found {trace_response.total_count} traces")
+    
+    assert not isinstance(log_response, Exception), f"Log search failed: {log_response}"
+    report(f"✅ Found {log_response.total_count} logs")
+    
+    # The example service does not necessarily exist in the cluster
+    if isinstance(health, Exception):
+        report(f"⚠️  Service health check failed: {health}")
+    else:
+        report(f"✅ Service health: {health.status}")
@@ -0,0 +1,74 @@
+"""Integration tests for the OTEL Collector driver against a running collector.
+
+Start a collector first, e.g.::
+
+    docker run -p 4317:4317 otel/opentelemetry-collector:latest
+
+The endpoint defaults to localhost:4317 and can be changed with
+OTEL_COLLECTOR_ENDPOINT. The tests are skipped if the collector is not reachable.
+"""
+
+import asyncio
+import os
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+
+pytest.importorskip("opentelemetry.proto")
+
+from otel_query_server.config import OTELCollectorConfig
+from otel_query_server.drivers.otel_collector import OTELCollectorDriver
+from otel_query_server.models import LogSearchParams, TimeRange, TraceSearchParams
+
+pytestmark = [pytest.mark.integration, pytest.mark.asyncio(loop_scope="module")]
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def otel_collector_driver(async_test_timeout):
+    """Create an OTEL Collector driver shared by the tests in this module."""
+    endpoint = os.getenv("OTEL_COLLECTOR_ENDPOINT", "localhost:4317")
+    driver = OTELCollectorDriver(OTELCollectorConfig(endpoint=endpoint, insecure=True))
+    
+    try:
+        await asyncio.wait_for(driver.initialize(), async_test_timeout)
+    except Exception as e:
+        pytest.skip(f"OTEL Collector not reachable at {endpoint}: {e}")
+    
+    yield driver
+    await asyncio.wait_for(driver.close(), 2.0)
+
+
+async def test_otel_collector_driver(otel_collector_driver, async_test_timeout):
+    """Test that queries through the collector complete.
+    
+    The OTEL Collector is a data pipeline, not a storage backend, so these
+    queries return empty results unless it is connected to a backend.
+    """
+    now = datetime.now(timezone.utc)
+    trace_params = TraceSearchParams(
+        time_range=TimeRange(
+            start=now - timedelta(hours=24),
+            end=now
+        ),
+        limit=5
+    )
+    log_params = LogSearchParams(
+        time_range=TimeRange(
+            start=now - timedelta(hours=1),
+            end=now
+        ),
+        limit=10
+    )
+    
+    # The three queries are independent, so run them concurrently
+    trace_response, log_response, health = await asyncio.gather(
+        asyncio.wait_for(otel_collector_driver.search_traces(trace_params), async_test_timeout),
+        asyncio.wait_for(otel_collector_driver.search_logs(log_params), async_test_timeout),
+        asyncio.wait_for(otel_collector_driver.get_service_health("example-service"), async_test_timeout),
+        return_exceptions=True
+    )
+    
+    assert not isinstance(trace_response, Exception), f"Trace search failed: {trace_response}"
+    assert not isinstance(log_response, Exception), f"Log search failed: {log_response}"
+    assert not isinstance(health, Exception), f"Service health check failed: {health}"
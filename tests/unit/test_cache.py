@@ -1,11 +1,14 @@
 """Unit tests for caching layer."""
 
 import asyncio
-import time
+import functools
 from datetime import datetime, timezone
+from typing import Any, Dict
 from unittest.mock import MagicMock, patch
 
 import pytest
+from hypothesis import given
+from hypothesis import strategies as st
 
 from otel_query_server.cache import (
     Cache,
@@ -19,78 +22,85 @@ from otel_query_server.cache import (
 from otel_query_server.config import CacheConfig
 from otel_query_server.models import TimeRange, TraceSearchParams
 
+_PARAMS_STRATEGY = st.dictionaries(st.text(), st.one_of(st.integers(), st.text()))
+
+# Key generation inputs, shared by tests and never mutated
+_DICT_PARAMS = {
+    "service": "test-service",
+    "limit": 100,
+    "start_time": "2024-01-01T00:00:00Z"
+}
+_TRACE_PARAMS = TraceSearchParams(
+    time_range=TimeRange(
+        start=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        end=datetime(2024, 1, 2, tzinfo=timezone.utc)
+    ),
+    service_name="test-service",
+    limit=100
+)
+
+
+@functools.cache
+def _cfg(**kwargs: Any) -> CacheConfig:
+    """Create a cache configuration, built once per distinct set of arguments.
+    
+    The returned instance is shared, use model_copy before changing it.
+    """
+    return CacheConfig(**kwargs)
+
+
+async def _bulk_set(cache: Cache, items: Dict[str, Any]) -> None:
+    """Set several cache entries concurrently, in insertion order."""
+    await asyncio.gather(*(cache.set(key, value) for key, value in items.items()))
+
 
 class TestCacheStats:
     """Test CacheStats functionality."""
     
-    def test_init(self):
-        """Test stats initialization."""
-        stats = CacheStats()
-        assert stats.hits == 0
-        assert stats.misses == 0
-        assert stats.evictions == 0
-        assert stats.errors == 0
-    
-    def test_total_requests(self):
-        """Test total requests calculation."""
-        stats = CacheStats()
-        stats.hits = 10
-        stats.misses = 5
-        assert stats.total_requests == 15
-    
-    def test_hit_rate(self):
-        """Test hit rate calculation."""
-        stats = CacheStats()
-        
-        # No requests
-        assert stats.hit_rate == 0.0
-        
-        # Some hits and misses
-        stats.hits = 75
-        stats.misses = 25
-        assert stats.hit_rate == 0.75
-        
+    @pytest.mark.parametrize("hits, misses, evictions, errors, reset, expected", [
+        # Fresh stats
+        (0, 0, 0, 0, False, {"total_requests": 0, "hit_rate": 0.0}),
+        (10, 5, 0, 0, False, {"total_requests": 15, "hit_rate": 10 / 15}),
+        (75, 25, 0, 0, False, {"total_requests": 100, "hit_rate": 0.75}),
         # All hits
-        stats.hits = 100
-        stats.misses = 0
-        assert stats.hit_rate == 1.0
-    
-    def test_reset(self):
-        """Test stats reset."""
-        stats = CacheStats()
-        stats.hits = 10
-        stats.misses = 5
-        stats.evictions = 3
-        stats.errors = 1
-        
-        stats.reset()
-        
-        assert stats.hits == 0
-        assert stats.misses == 0
-        assert stats.evictions == 0
-        assert stats.errors == 0
-    
-    def test_to_dict(self):
-        """Test stats dictionary conversion."""
+        (100, 0, 0, 0, False, {"total_requests": 100, "hit_rate": 1.0}),
+        (80, 20, 5, 2, False, {"total_requests": 100, "hit_rate": 0.8}),
+        # Everything is zeroed by reset
+        (10, 5, 3, 1, True, {"total_requests": 0, "hit_rate": 0.0}),
+    ])
+    def test_stats(self, hits, misses, evictions, errors, reset, expected):
+        """Test derived values, reset and dictionary conversion."""
         stats = CacheStats()
-        stats.hits = 80
-        stats.misses = 20
-        stats.evictions = 5
-        stats.errors = 2
-        
-        result = stats.to_dict()
-        
-        assert result["hits"] == 80
-        assert result["misses"] == 20
-        assert result["evictions"] == 5
-        assert result["errors"] == 2
-        assert result["total_requests"] == 100
-        assert result["hit_rate"] == 0.8
+        stats.hits = hits
+        stats.misses = misses
+        stats.evictions = evictions
+        stats.errors = errors
+        
+        if reset:
+            stats.reset()
+            hits = misses = evictions = errors = 0
+        
+        assert stats.total_requests == expected["total_requests"]
+        assert stats.hit_rate == expected["hit_rate"]
+        assert stats.to_dict() == {
+            "hits": hits,
+            "misses": misses,
+            "evictions": evictions,
+            "errors": errors,
+            **expected
+        }
 
 
 class TestCacheEntry:
     """Test CacheEntry functionality."""
     
+    @pytest.fixture
+    def clock(self):
+        """Replace the cache clock with one advanced by the test."""
+        now = [1000.0]
+        with patch("otel_query_server.cache._now", lambda: now[0]):
+            yield now
+    
     def test_init(self):
         """Test entry initialization."""
         value = {"test": "data"}
@@ -104,7 +114,7 @@ class TestCacheEntry:
         assert entry.created_at > 0
         assert entry.last_accessed == entry.created_at
     
-    def test_is_expired(self):
+    def test_is_expired(self, clock):
         """Test expiration check."""
         entry = CacheEntry("test", ttl=1)
         
@@ -112,22 +122,23 @@ class TestCacheEntry:
         assert not entry.is_expired
         
         # Expired after TTL
-        time.sleep(1.1)
+        clock[0] += 1.01
         assert entry.is_expired
     
-    def test_access(self):
+    def test_access(self, clock):
         """Test accessing entry."""
         value = {"test": "data"}
         entry = CacheEntry(value, ttl=300)
         
         # First access
+        clock[0] += 0.01
         result = entry.access()
         assert result == value
         assert entry.access_count == 1
         assert entry.last_accessed > entry.created_at
         
         # Second access
-        time.sleep(0.01)
+        clock[0] += 0.01
         last_accessed = entry.last_accessed
         result = entry.access()
         assert result == value
@@ -138,10 +149,11 @@ class TestCacheEntry:
 class TestCache:
     """Test Cache functionality."""
     
-    @pytest.fixture
-    def config(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def config(cls):
         """Create test cache configuration."""
-        return CacheConfig(
+        return _cfg(
             enabled=True,
             max_size=30,
             ttl_seconds=300,
@@ -150,11 +162,19 @@ class TestCache:
             metric_ttl_seconds=60
         )
     
-    @pytest.fixture
-    def cache(self, config):
-        """Create test cache instance."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def shared_cache(cls, config):
+        """Create a cache instance shared by the tests in this class."""
         return Cache(config)
     
+    @pytest.fixture
+    async def cache(self, shared_cache):
+        """Provide the shared cache, empty and with fresh statistics."""
+        await shared_cache.clear()
+        shared_cache.stats.reset()
+        return shared_cache
+    
     def test_init(self, cache, config):
         """Test cache initialization."""
         assert cache.config == config
@@ -166,42 +186,42 @@ class TestCache:
     
     def test_generate_key_with_dict(self):
         """Test key generation with dictionary."""
-        params = {
-            "service": "test-service",
-            "limit": 100,
-            "start_time": "2024-01-01T00:00:00Z"
-        }
-        
-        key = Cache._generate_key("traces", params)
+        key = Cache._generate_key("traces", _DICT_PARAMS)
         
         assert key.startswith("traces:")
         assert len(key) > len("traces:")
         
         # Same params should generate same key
-        key2 = Cache._generate_key("traces", params)
+        key2 = Cache._generate_key("traces", _DICT_PARAMS)
         assert key == key2
         
         # Different params should generate different key
-        params["limit"] = 200
-        key3 = Cache._generate_key("traces", params)
+        key3 = Cache._generate_key("traces", {**_DICT_PARAMS, "limit": 200})
         assert key != key3
     
     def test_generate_key_with_model(self):
         """Test key generation with Pydantic model."""
-        params = TraceSearchParams(
-            time_range=TimeRange(
-                start=datetime(2024, 1, 1, tzinfo=timezone.utc),
-                end=datetime(2024, 1, 2, tzinfo=timezone.utc)
-            ),
-            service_name="test-service",
-            limit=100
-        )
-        
-        key = Cache._generate_key("traces", params)
+        key = Cache._generate_key("traces", _TRACE_PARAMS)
         
         assert key.startswith("traces:")
         assert len(key) > len("traces:")
     
+    @given(params=_PARAMS_STRATEGY)
+    def test_generate_key_fixed_length(self, params):
+        """Test that keys are deterministic and carry a KEY_BYTES hash."""
+        key = Cache._generate_key("traces", params)
+        
+        assert key == Cache._generate_key("traces", dict(params))
+        prefix, param_hash = key.split(":", 1)
+        assert prefix == "traces"
+        assert len(param_hash) == Cache.KEY_BYTES * 2
+        int(param_hash, 16)  # Hex encoded
+    
+    @given(params=_PARAMS_STRATEGY)
+    def test_generate_key_prefixes_disjoint(self, params):
+        """Test that equal parameters give different keys per prefix."""
+        assert Cache._generate_key("traces", params) != Cache._generate_key("logs", params)
+    
     def test_get_cache_for_prefix(self, cache):
         """Test getting cache by prefix."""
         assert cache._get_cache_for_prefix("traces") is cache._trace_cache
@@ -229,8 +249,7 @@ class TestCache:
     
     async def test_disabled_cache(self, config):
         """Test operations with disabled cache."""
-        config.enabled = False
-        cache = Cache(config)
+        cache = Cache(config.model_copy(update={"enabled": False}))
         
         key = "traces:test"
         value = {"test": "data"}
@@ -269,9 +288,11 @@ class TestCache:
     async def test_clear_all(self, cache):
         """Test clearing all caches."""
         # Add values to different caches
-        await cache.set("traces:1", {"trace": 1})
-        await cache.set("logs:1", {"log": 1})
-        await cache.set("metrics:1", {"metric": 1})
+        await _bulk_set(cache, {
+            "traces:1": {"trace": 1},
+            "logs:1": {"log": 1},
+            "metrics:1": {"metric": 1}
+        })
         
         # Clear all
         await cache.clear()
@@ -284,8 +305,7 @@ class TestCache:
     async def test_clear_prefix(self, cache):
         """Test clearing specific cache."""
         # Add values to different caches
-        await cache.set("traces:1", {"trace": 1})
-        await cache.set("logs:1", {"log": 1})
+        await _bulk_set(cache, {"traces:1": {"trace": 1}, "logs:1": {"log": 1}})
         
         # Clear only traces
         await cache.clear("traces")
@@ -297,8 +317,7 @@ class TestCache:
     async def test_eviction_tracking(self, cache):
         """Test eviction tracking."""
         # Fill trace cache to capacity
-        for i in range(10):
-            await cache.set(f"traces:{i}", {"value": i})
+        await _bulk_set(cache, {f"traces:{i}": {"value": i} for i in range(10)})
         
         assert cache.stats.evictions == 0
         
@@ -308,13 +327,17 @@ class TestCache:
         # cachetools handles eviction, so we track it
         assert cache.stats.evictions == 1
     
-    async def test_error_handling(self, cache):
+    async def test_error_handling(self, cache, monkeypatch):
         """Test error handling in cache operations."""
-        # Mock an error in get operation
-        with patch.object(cache, "_get_cache_for_prefix", side_effect=Exception("Test error")):
-            result = await cache.get("traces:test")
-            assert result is None
-            assert cache.stats.errors == 1
+        def failing_get_cache(prefix):
+            raise Exception("Test error")
+        
+        # Make the get operation fail, monkeypatch restores the shared cache
+        monkeypatch.setattr(cache, "_get_cache_for_prefix", failing_get_cache)
+        
+        result = await cache.get("traces:test")
+        assert result is None
+        assert cache.stats.errors == 1
     
     def test_get_stats(self, cache):
         """Test getting cache statistics."""
@@ -346,7 +369,7 @@ class TestCacheDecorator:
     @pytest.fixture
     def cache_config(self):
         """Create test cache configuration."""
-        return CacheConfig(enabled=True, max_size=10)
+        return _cfg(enabled=True, max_size=10)
     
     @pytest.fixture
     def mock_cache(self, cache_config):
@@ -394,7 +417,7 @@ class TestGlobalCache:
         assert get_cache() is None
         
         # Set cache
-        config = CacheConfig()
+        config = _cfg()
         cache = Cache(config)
         set_cache(cache)
         
@@ -403,7 +426,7 @@ class TestGlobalCache:
     
     def test_init_cache(self):
         """Test cache initialization."""
-        config = CacheConfig(enabled=True, max_size=100)
+        config = _cfg(enabled=True, max_size=100)
         
         cache = init_cache(config)
         
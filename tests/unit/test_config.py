@@ -1,9 +1,8 @@
 """Unit tests for configuration management."""
 
 import os
-import tempfile
-from pathlib import Path
-from unittest.mock import patch
+from pathlib import PurePosixPath
+from unittest.mock import mock_open, patch
 
 import pytest
 import yaml
@@ -23,6 +22,32 @@ from otel_query_server.config import (
     set_config,
 )
 
+YAML_CONTENT = """
+server:
+  name: test-server
+  log_level: DEBUG
+
+cache:
+  enabled: false
+  max_size: 500
+
+backends:
+  otel_collector:
+    endpoint: test:4317
+    insecure: false
+"""
+
+
+class _ConfigYamlOnlyPath(PurePosixPath):
+    """Path stand-in for which only config.yaml in the current directory exists."""
+    
+    @classmethod
+    def home(cls) -> "_ConfigYamlOnlyPath":
+        return cls("/home/test")
+    
+    def exists(self) -> bool:
+        return self == PurePosixPath("config.yaml")
+
 
 class TestOTELCollectorConfig:
     """Test OTEL Collector configuration."""
@@ -180,38 +205,19 @@ class TestConfig:
         assert config.cache.enabled is True
         assert config.cache.max_size == 1000
     
-    def test_from_yaml(self):
+    def test_from_yaml(self, tmp_path):
         """Test loading configuration from YAML."""
-        yaml_content = """
-server:
-  name: test-server
-  log_level: DEBUG
-
-cache:
-  enabled: false
-  max_size: 500
-
-backends:
-  otel_collector:
-    endpoint: test:4317
-    insecure: false
-"""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(YAML_CONTENT)
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(yaml_content)
-            f.flush()
-            
-            try:
-                config = Config.from_yaml(f.name)
-                
-                assert config.server.name == "test-server"
-                assert config.server.log_level == "DEBUG"
-                assert config.cache.enabled is False
-                assert config.cache.max_size == 500
-                assert config.backends.otel_collector.endpoint == "test:4317"
-                assert config.backends.otel_collector.insecure is False
-            finally:
-                os.unlink(f.name)
+        config = Config.from_yaml(str(config_file))
+        
+        assert config.server.name == "test-server"
+        assert config.server.log_level == "DEBUG"
+        assert config.cache.enabled is False
+        assert config.cache.max_size == 500
+        assert config.backends.otel_collector.endpoint == "test:4317"
+        assert config.backends.otel_collector.insecure is False
     
     def test_from_env(self):
         """Test loading configuration from environment variables."""
@@ -265,47 +271,38 @@ backends:
 class TestConfigLoading:
     """Test configuration loading functions."""
     
-    def test_load_config_with_path(self):
+    def test_load_config_with_path(self, tmp_path):
         """Test loading config with explicit path."""
-        yaml_content = """
-server:
-  name: file-server
-"""
+        config_file = tmp_path / "custom.yaml"
+        config_file.write_text(YAML_CONTENT.replace("test-server", "file-server"))
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(yaml_content)
-            f.flush()
-            
-            try:
-                config = load_config(f.name)
-                assert config.server.name == "file-server"
-            finally:
-                os.unlink(f.name)
+        config = load_config(str(config_file))
+        assert config.server.name == "file-server"
     
-    def test_load_config_from_default_location(self):
+    def test_load_config_from_default_location(self, tmp_path, monkeypatch):
         """Test loading from default location."""
-        # Create config.yaml in current directory
-        yaml_content = """
-server:
-  name: default-server
-"""
-        
-        with open("config.yaml", "w") as f:
-            f.write(yaml_content)
+        # Create config.yaml in a temporary current directory
+        (tmp_path / "config.yaml").write_text(YAML_CONTENT.replace("test-server", "default-server"))
+        monkeypatch.chdir(tmp_path)
         
-        try:
+        config = load_config()
+        assert config.server.name == "default-server"
+    
+    def test_load_config_from_default_location_in_memory(self):
+        """Test loading from default location without touching the filesystem."""
+        yaml_content = YAML_CONTENT.replace("test-server", "in-memory-server")
+        with patch("otel_query_server.config.Path", _ConfigYamlOnlyPath), \
+                patch("otel_query_server.config.open", mock_open(read_data=yaml_content), create=True) as opened:
             config = load_config()
-            assert config.server.name == "default-server"
-        finally:
-            if Path("config.yaml").exists():
-                os.unlink("config.yaml")
+        
+        opened.assert_called_once_with(_ConfigYamlOnlyPath("config.yaml"), "r")
+        assert config.server.name == "in-memory-server"
     
-    def test_load_config_fallback_to_env(self):
+    def test_load_config_fallback_to_env(self, tmp_path, monkeypatch):
         """Test fallback to environment variables."""
-        # Ensure no default config files exist
-        for path in ["config.yaml", "config.yml"]:
-            if Path(path).exists():
-                os.unlink(path)
+        # Run from an empty directory and home so no default config files exist
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("HOME", str(tmp_path))
         
         with patch.dict(os.environ, {"OTEL_QUERY_SERVER__NAME": "env-fallback"}):
             config = load_config()
@@ -0,0 +1,47 @@
+"""Unit tests for the Elastic Cloud driver."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from otel_query_server.config import ElasticCloudConfig
+from otel_query_server.drivers.elastic_cloud import ElasticCloudDriver
+
+
+class TestElasticCloudDriverClient:
+    """Test sharing an existing Elasticsearch client with the driver."""
+    
+    @pytest.fixture
+    def config(self):
+        """Create test configuration."""
+        return ElasticCloudConfig(elasticsearch_url="https://localhost:9200")
+    
+    @pytest.fixture
+    def client(self):
+        """Create a mock async Elasticsearch client."""
+        client = MagicMock()
+        client.info = AsyncMock(return_value={
+            "cluster_name": "test-cluster",
+            "version": {"number": "8.11.0"}
+        })
+        client.close = AsyncMock()
+        return client
+    
+    async def test_uses_injected_client(self, config, client):
+        """Test that the driver connects with the provided client."""
+        driver = ElasticCloudDriver(config, client=client)
+        
+        await driver.initialize()
+        
+        assert driver.client is client
+        client.info.assert_called_once()
+    
+    async def test_does_not_close_injected_client(self, config, client):
+        """Test that a shared client stays open after the driver closes."""
+        driver = ElasticCloudDriver(config, client=client)
+        await driver.initialize()
+        
+        await driver.close()
+        
+        client.close.assert_not_called()
+        assert driver.client is client
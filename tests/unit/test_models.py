@@ -1,6 +1,6 @@
 """Unit tests for Pydantic models."""
 
-from datetime import datetime, timedelta, timezone
+from datetime import timedelta
 
 import pytest
 from pydantic import ValidationError
@@ -23,6 +23,8 @@ from otel_query_server.models import (
     TraceSearchParams,
     TraceStatus,
 )
+from tests.factories import BASE_TIME, default_time_range, trace_from_spans
+from tests.fixtures.backend_responses import BackendResponseFixtures
 
 
 class TestTimeRange:
@@ -30,7 +32,7 @@ class TestTimeRange:
     
     def test_valid_time_range(self):
         """Test creating a valid time range."""
-        start = datetime.now(timezone.utc)
+        start = BASE_TIME
         end = start + timedelta(hours=1)
         
         time_range = TimeRange(start=start, end=end)
@@ -39,7 +41,7 @@ class TestTimeRange:
     
     def test_invalid_time_range_end_before_start(self):
         """Test that end time must be after start time."""
-        start = datetime.now(timezone.utc)
+        start = BASE_TIME
         end = start - timedelta(hours=1)
         
         with pytest.raises(ValidationError, match="End time must be after start time"):
@@ -47,7 +49,7 @@ class TestTimeRange:
     
     def test_equal_start_end_invalid(self):
         """Test that start and end cannot be equal."""
-        time = datetime.now(timezone.utc)
+        time = BASE_TIME
         
         with pytest.raises(ValidationError, match="End time must be after start time"):
             TimeRange(start=time, end=time)
@@ -58,7 +60,7 @@ class TestSpan:
     
     def test_create_minimal_span(self):
         """Test creating a span with minimal required fields."""
-        start = datetime.now(timezone.utc)
+        start = BASE_TIME
         end = start + timedelta(milliseconds=100)
         
         span = Span(
@@ -80,7 +82,7 @@ class TestSpan:
     
     def test_span_duration_calculation(self):
         """Test automatic duration calculation from timestamps."""
-        start = datetime.now(timezone.utc)
+        start = BASE_TIME
         end = start + timedelta(milliseconds=250)
         
         span = Span(
@@ -98,7 +100,7 @@ class TestSpan:
     
     def test_span_with_all_fields(self):
         """Test creating a span with all optional fields."""
-        start = datetime.now(timezone.utc)
+        start = BASE_TIME
         end = start + timedelta(milliseconds=100)
         
         span = Span(
@@ -129,7 +131,7 @@ class TestTrace:
     
     def test_create_trace_from_spans(self):
         """Test creating a trace from a list of spans."""
-        base_time = datetime.now(timezone.utc)
+        base_time = BASE_TIME
         
         spans = [
             Span(
@@ -161,6 +163,23 @@ class TestTrace:
         assert trace.duration_ms == 100.0
         assert set(trace.service_names) == {"service1", "service2"}
     
+    def test_trace_factory_matches_from_spans(self):
+        """Test that the unvalidated test factory derives the same fields."""
+        spans = [
+            Span(
+                trace_id="trace123",
+                span_id=f"span{i}",
+                operation_name="operation",
+                service_name=f"service{i}",
+                start_time=BASE_TIME + timedelta(milliseconds=10 * i),
+                end_time=BASE_TIME + timedelta(milliseconds=50 + 10 * i),
+                duration_ns=50_000_000
+            )
+            for i in range(2)
+        ]
+        
+        assert trace_from_spans("trace123", spans) == Trace.from_spans("trace123", spans)
+    
     def test_create_trace_from_empty_spans(self):
         """Test that creating a trace from empty spans raises error."""
         with pytest.raises(ValueError, match="Cannot create trace from empty span list"):
@@ -172,7 +191,7 @@ class TestLogEntry:
     
     def test_create_minimal_log(self):
         """Test creating a log with minimal fields."""
-        timestamp = datetime.now(timezone.utc)
+        timestamp = BASE_TIME
         
         log = LogEntry(
             timestamp=timestamp,
@@ -191,7 +210,7 @@ class TestLogEntry:
     def test_log_with_trace_context(self):
         """Test creating a log with trace context."""
         log = LogEntry(
-            timestamp=datetime.now(timezone.utc),
+            timestamp=BASE_TIME,
             level=LogLevel.ERROR,
             message="Error occurred",
             service_name="test-service",
@@ -210,7 +229,7 @@ class TestMetric:
     
     def test_create_metric(self):
         """Test creating a metric with data points."""
-        base_time = datetime.now(timezone.utc)
+        base_time = BASE_TIME
         
         data_points = [
             MetricDataPoint(
@@ -246,10 +265,7 @@ class TestQueryParams:
     
     def test_trace_search_params_minimal(self):
         """Test minimal trace search parameters."""
-        time_range = TimeRange(
-            start=datetime.now(timezone.utc) - timedelta(hours=1),
-            end=datetime.now(timezone.utc)
-        )
+        time_range = default_time_range()
         
         params = TraceSearchParams(time_range=time_range)
         
@@ -260,10 +276,7 @@ class TestQueryParams:
     
     def test_trace_search_params_full(self):
         """Test trace search with all parameters."""
-        time_range = TimeRange(
-            start=datetime.now(timezone.utc) - timedelta(hours=1),
-            end=datetime.now(timezone.utc)
-        )
+        time_range = default_time_range()
         
         params = TraceSearchParams(
             service_name="test-service",
@@ -286,10 +299,7 @@ class TestQueryParams:
     
     def test_log_search_params(self):
         """Test log search parameters."""
-        time_range = TimeRange(
-            start=datetime.now(timezone.utc) - timedelta(hours=1),
-            end=datetime.now(timezone.utc)
-        )
+        time_range = default_time_range()
         
         params = LogSearchParams(
             service_name="test-service",
@@ -306,10 +316,7 @@ class TestQueryParams:
     
     def test_metric_query_params(self):
         """Test metric query parameters."""
-        time_range = TimeRange(
-            start=datetime.now(timezone.utc) - timedelta(hours=1),
-            end=datetime.now(timezone.utc)
-        )
+        time_range = default_time_range()
         
         params = MetricQueryParams(
             metric_name="http_requests_*",
@@ -327,10 +334,7 @@ class TestQueryParams:
     
     def test_invalid_aggregation(self):
         """Test that invalid aggregation is rejected."""
-        time_range = TimeRange(
-            start=datetime.now(timezone.utc) - timedelta(hours=1),
-            end=datetime.now(timezone.utc)
-        )
+        time_range = default_time_range()
         
         with pytest.raises(ValidationError):
             MetricQueryParams(
@@ -348,7 +352,7 @@ class TestServiceHealth:
         health = ServiceHealth(
             service_name="test-service",
             status="healthy",
-            last_seen=datetime.now(timezone.utc)
+            last_seen=BASE_TIME
         )
         
         assert health.service_name == "test-service"
@@ -365,7 +369,7 @@ class TestServiceHealth:
             error_rate=0.05,
             latency_p99_ms=250.5,
             request_rate=100.0,
-            last_seen=datetime.now(timezone.utc),
+            last_seen=BASE_TIME,
             attributes={"version": "1.2.3", "region": "us-east-1"}
         )
         
@@ -374,4 +378,36 @@ class TestServiceHealth:
         assert health.error_rate == 0.05
         assert health.latency_p99_ms == 250.5
         assert health.request_rate == 100.0
-        assert health.attributes["version"] == "1.2.3" 
\ No newline at end of file
+        assert health.attributes["version"] == "1.2.3"
+
+
+class TestBackendResponseFixtures:
+    """Test that mock backend responses still match the models."""
+    
+    @pytest.mark.parametrize("factory, args", [
+        (BackendResponseFixtures.create_trace_response, (10,)),
+        (BackendResponseFixtures.create_log_response, (20,)),
+        (BackendResponseFixtures.create_metric_response, (20,)),
+        (BackendResponseFixtures.create_service_health_response, ("frontend-degraded",)),
+    ])
+    def test_fixture_validates(self, factory, args):
+        """Test that a fixture built without validation passes validation."""
+        response = factory(*args)
+        
+        validated = type(response).model_validate(response.model_dump())
+        
+        assert validated == response
+    
+    def test_big_trace_response_round_trip(self, big_trace_response):
+        """Test that a serialized trace response loads back unchanged."""
+        assert len(big_trace_response.traces) == 50
+        assert big_trace_response == BackendResponseFixtures.create_trace_response(50)
+    
+    def test_metric_labels_are_set_per_data_point(self):
+        """Test that data point labels are validated fields, not a shared dict."""
+        first, second = BackendResponseFixtures.create_metric_response(1).metrics[0].data_points[:2]
+        
+        assert "labels" in first.model_fields_set
+        assert first.model_dump(exclude_unset=True)["labels"] == first.labels
+        assert first.labels == second.labels
+        assert first.labels is not second.labels
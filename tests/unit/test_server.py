@@ -6,16 +6,29 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from otel_query_server.config import BackendsConfig, CacheConfig, Config, ServerConfig
-from otel_query_server.server import OTelQueryServer, main
+from otel_query_server.config import (
+    BackendConfig,
+    BackendsConfig,
+    CacheConfig,
+    Config,
+    OTELCollectorConfig,
+    ServerConfig,
+)
+from otel_query_server.server import OTelQueryServer, install_event_loop_policy, main
+from tests.utils import MockDriver
+
+
+async def _noop(*args, **kwargs):
+    """Async stand-in for methods whose calls are not asserted."""
 
 
 class TestOTelQueryServer:
     """Test OTelQueryServer functionality."""
     
-    @pytest.fixture
-    def config(self):
-        """Create test configuration."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def config(cls):
+        """Create test configuration, shared by the class (do not mutate)."""
         return Config(
             server=ServerConfig(
                 name="test-server",
@@ -27,6 +40,11 @@ class TestOTelQueryServer:
             backends=BackendsConfig()
         )
     
+    @pytest.fixture
+    def mutable_config(self, config):
+        """Create a copy of the test configuration that may be modified."""
+        return config.model_copy(deep=True)
+    
     @pytest.fixture
     def server(self, config):
         """Create test server instance."""
@@ -44,6 +62,11 @@ class TestOTelQueryServer:
         assert server.server_info["description"] == "Test server"
         assert server.drivers == {}
     
+    def test_server_info_is_read_only(self, server):
+        """Test that server info cannot be mutated."""
+        with pytest.raises(TypeError):
+            server.server_info["name"] = "other-server"
+    
     def test_server_info_registration(self, server):
         """Test server info setup."""
         # The server should have called _setup_server_info
@@ -57,15 +80,37 @@ class TestOTelQueryServer:
                 server = OTelQueryServer(config)
                 mock_set_config.assert_called_once_with(config)
     
+    @patch("otel_query_server.server.set_config")
+    @patch("otel_query_server.server.get_config")
+    def test_global_config_not_reset(self, mock_get_config, mock_set_config, config):
+        """Test that the global config is not set again when used as default."""
+        mock_get_config.return_value = config
+        
+        with patch("otel_query_server.server.FastMCP"):
+            with patch("otel_query_server.server.init_cache"):
+                server = OTelQueryServer()
+        
+        assert server.config is config
+        mock_set_config.assert_not_called()
+    
+    def test_logger_shared_between_servers(self, server, config):
+        """Test that servers with the same name share a bound logger."""
+        with patch("otel_query_server.server.FastMCP"):
+            with patch("otel_query_server.server.init_cache"):
+                other = OTelQueryServer(config)
+        
+        assert other.logger is server.logger
+    
     async def test_initialize_drivers_no_backends(self, server):
         """Test driver initialization with no backends configured."""
         await server.initialize_drivers()
         assert len(server.drivers) == 0
     
-    async def test_initialize_drivers_with_backends(self, config):
+    async def test_initialize_drivers_with_backends(self, mutable_config):
         """Test driver initialization with backends configured."""
         from otel_query_server.config import OTELCollectorConfig
         
+        config = mutable_config
         config.backends.otel_collector = OTELCollectorConfig(
             endpoint="localhost:4317",
             enabled=True
@@ -79,6 +124,64 @@ class TestOTelQueryServer:
                 # Since drivers aren't implemented yet, should still be empty
                 assert len(server.drivers) == 0
     
+    async def test_warmup_drivers(self, server):
+        """Test warming up drivers with one failing driver."""
+        ok_driver = AsyncMock()
+        failing_driver = AsyncMock()
+        failing_driver.warmup.side_effect = Exception("Warmup failed")
+        server.drivers = {
+            "ok": ok_driver,
+            "failing": failing_driver
+        }
+        
+        # Should not raise, just log error
+        await server.warmup_drivers()
+        
+        ok_driver.warmup.assert_called_once()
+        failing_driver.warmup.assert_called_once()
+    
+    async def test_single_flight_shares_concurrent_queries(self, server):
+        """Test that identical concurrent queries hit the backend once."""
+        calls = 0
+        release = asyncio.Event()
+        
+        async def query():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return {"total_count": calls}
+        
+        key = ("search_traces", "test-service")
+        waiters = [asyncio.ensure_future(server._single_flight(key, query)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*waiters)
+        
+        assert calls == 1
+        assert results == [{"total_count": 1}] * 5
+        assert server._inflight == {}
+    
+    async def test_single_flight_distinct_keys(self, server):
+        """Test that queries with different keys run independently."""
+        query = AsyncMock(return_value="result")
+        
+        await asyncio.gather(
+            server._single_flight(("search_logs", "a"), query),
+            server._single_flight(("search_logs", "b"), query)
+        )
+        
+        assert query.await_count == 2
+    
+    async def test_single_flight_error(self, server):
+        """Test that a failed query is not kept in flight."""
+        async def query():
+            raise Exception("Backend error")
+        
+        with pytest.raises(Exception, match="Backend error"):
+            await server._single_flight(("get_service_health", "svc"), query)
+        
+        assert server._inflight == {}
+    
     async def test_close_drivers_empty(self, server):
         """Test closing drivers when none exist."""
         await server.close_drivers()
@@ -87,8 +190,8 @@ class TestOTelQueryServer:
     async def test_close_drivers_with_drivers(self, server):
         """Test closing drivers."""
         # Add mock drivers
-        mock_driver1 = AsyncMock()
-        mock_driver2 = AsyncMock()
+        mock_driver1 = MockDriver(BackendConfig())
+        mock_driver2 = MockDriver(BackendConfig())
         server.drivers = {
             "driver1": mock_driver1,
             "driver2": mock_driver2
@@ -96,19 +199,19 @@ class TestOTelQueryServer:
         
         await server.close_drivers()
         
-        mock_driver1.close.assert_called_once()
-        mock_driver2.close.assert_called_once()
+        assert mock_driver1.close_call_count == 1
+        assert mock_driver2.close_call_count == 1
     
     async def test_close_drivers_with_error(self, server):
         """Test closing drivers with error."""
         # Add mock driver that raises error
-        mock_driver = AsyncMock()
-        mock_driver.close.side_effect = Exception("Close failed")
+        mock_driver = MockDriver(BackendConfig())
+        mock_driver.should_fail = True
         server.drivers = {"driver1": mock_driver}
         
         # Should not raise, just log error
         await server.close_drivers()
-        mock_driver.close.assert_called_once()
+        assert mock_driver.close_call_count == 1
     
     async def test_start(self, server):
         """Test starting the server."""
@@ -129,17 +232,30 @@ class TestOTelQueryServer:
         server.close_drivers.assert_called_once()
 
 
+def _main_config() -> Config:
+    """Create an unvalidated configuration with just what main reads.
+    
+    A real Config keeps attribute typos failing loudly, which a MagicMock
+    would silently accept. The collector backend lets validate_backends pass.
+    """
+    return Config.model_construct(
+        server=ServerConfig.model_construct(
+            name="test-server", version="0.0.0", description="", log_level="INFO"
+        ),
+        cache=CacheConfig.model_construct(enabled=False, max_size=0),
+        backends=BackendsConfig.model_construct(
+            otel_collector=OTELCollectorConfig.model_construct(endpoint="localhost:4317")
+        ),
+    )
+
+
 class TestMain:
     """Test main function."""
     
     @pytest.fixture
     def mock_config(self):
-        """Create mock configuration."""
-        config = MagicMock()
-        config.server = MagicMock()
-        config.server.log_level = "INFO"
-        config.validate_backends = MagicMock()
-        return config
+        """Create a configuration for main, loaded through a patched load_config."""
+        return _main_config()
     
     @patch("otel_query_server.server.load_config")
     @patch("otel_query_server.server.OTelQueryServer")
@@ -154,11 +270,26 @@ class TestMain:
         mock_loop.return_value = MagicMock()
         
         # Run main without actually starting the server
-        with patch.object(mock_server, "start", new=AsyncMock()):
+        with patch.object(mock_server, "start", new=_noop), \
+                patch.object(Config, "validate_backends", autospec=True) as mock_validate:
             await main("/path/to/config.yaml")
         
         mock_load_config.assert_called_once_with("/path/to/config.yaml")
-        mock_config.validate_backends.assert_called_once()
+        mock_validate.assert_called_once_with(mock_config)
+        mock_server_class.assert_called_once_with(mock_config)
+    
+    @patch("otel_query_server.server.load_config")
+    @patch("otel_query_server.server.OTelQueryServer")
+    @patch("asyncio.get_event_loop")
+    async def test_main_with_loaded_config(self, mock_loop, mock_server_class, mock_load_config, mock_config):
+        """Test that a configuration passed to main is not loaded again."""
+        mock_server = AsyncMock()
+        mock_server_class.return_value = mock_server
+        
+        with patch.object(mock_server, "start", new=_noop):
+            await main(config=mock_config)
+        
+        mock_load_config.assert_not_called()
         mock_server_class.assert_called_once_with(mock_config)
     
     @patch("otel_query_server.server.load_config")
@@ -199,9 +330,7 @@ class TestSignalHandling:
         """Test that signal handlers are registered."""
         import signal
         
-        mock_config = MagicMock()
-        mock_config.server.log_level = "INFO"
-        mock_load_config.return_value = mock_config
+        mock_load_config.return_value = _main_config()
         
         mock_server = AsyncMock()
         mock_server_class.return_value = mock_server
@@ -209,7 +338,7 @@ class TestSignalHandling:
         mock_loop_instance = MagicMock()
         mock_loop.return_value = mock_loop_instance
         
-        with patch.object(mock_server, "start", new=AsyncMock()):
+        with patch.object(mock_server, "start", new=_noop):
             await main()
         
         # Check that signal handlers were registered
@@ -219,4 +348,35 @@ class TestSignalHandling:
         # Should register SIGTERM and SIGINT
         registered_signals = {call[0][0] for call in signal_calls}
         assert signal.SIGTERM in registered_signals
-        assert signal.SIGINT in registered_signals 
\ No newline at end of file
+        assert signal.SIGINT in registered_signals
+
+
+class TestEventLoopPolicy:
+    """Test event loop policy selection."""
+    
+    def test_disabled_by_config(self):
+        """Test that uvloop is not installed when disabled."""
+        config = Config(server=ServerConfig(use_uvloop=False))
+        
+        with patch("otel_query_server.server.asyncio.set_event_loop_policy") as mock_set_policy:
+            assert install_event_loop_policy(config) is False
+            mock_set_policy.assert_not_called()
+    
+    def test_not_installed(self):
+        """Test fallback to the default loop when uvloop is missing."""
+        config = Config(server=ServerConfig(use_uvloop=True))
+        
+        with patch.dict(sys.modules, {"uvloop": None, "winloop": None}):
+            with patch("otel_query_server.server.asyncio.set_event_loop_policy") as mock_set_policy:
+                assert install_event_loop_policy(config) is False
+                mock_set_policy.assert_not_called()
+    
+    def test_installed(self):
+        """Test that the uvloop policy is installed when available."""
+        config = Config(server=ServerConfig(use_uvloop=True))
+        loop_module = MagicMock(__name__="uvloop")
+        
+        with patch.dict(sys.modules, {"uvloop": loop_module, "winloop": loop_module}):
+            with patch("otel_query_server.server.asyncio.set_event_loop_policy") as mock_set_policy:
+                assert install_event_loop_policy(config) is True
+                mock_set_policy.assert_called_once_with(loop_module.EventLoopPolicy.return_value)
@@ -2,16 +2,56 @@
 
 import asyncio
 import functools
+import os
+import ssl
 import time
-from contextlib import asynccontextmanager
-from typing import Any, AsyncGenerator, Callable, Dict, List, Optional, TypeVar
+from functools import cache, lru_cache
+from typing import Any, Callable, Dict, List, Optional, TypeVar
 from unittest.mock import AsyncMock, MagicMock
 
+from pydantic import BaseModel
+
 from otel_query_server.drivers.base import BaseDriver
 
 T = TypeVar("T")
 
 
+@cache
+def get_ssl_context(verify: bool = True) -> ssl.SSLContext:
+    """Create an SSL context, cached so the CA bundle is parsed once."""
+    context = ssl.create_default_context()
+    if not verify:
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    return context
+
+
+@lru_cache(maxsize=8)
+def get_es_client(url: str, api_key: str, verify: bool = True, asynchronous: bool = False) -> Any:
+    """Create an Elasticsearch client, reused for identical arguments.
+    
+    Args:
+        url: Elasticsearch URL
+        api_key: API key for authentication
+        verify: Verify the server certificate
+        asynchronous: Create an AsyncElasticsearch client, e.g. for drivers
+    
+    Returns:
+        Elasticsearch or AsyncElasticsearch client
+    """
+    from elasticsearch import AsyncElasticsearch, Elasticsearch
+    
+    client_class = AsyncElasticsearch if asynchronous else Elasticsearch
+    return client_class(
+        [url],
+        api_key=api_key,
+        ssl_context=get_ssl_context(verify),
+        connections_per_node=(os.cpu_count() or 1) * 4,
+        http_compress=True,
+        request_timeout=30,
+    )
+
+
 def async_test(timeout: float = 5.0):
     """Decorator for async tests with timeout.
     
@@ -19,63 +59,73 @@ def async_test(timeout: float = 5.0):
         timeout: Test timeout in seconds
     """
     def decorator(func: Callable) -> Callable:
+        if not hasattr(asyncio, "timeout"):  # Python < 3.11
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                return await asyncio.wait_for(func(*args, **kwargs), timeout=timeout)
+            return wrapper
+        
+        # The test runs in the current task under a timer, no extra task needed
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
-            return await asyncio.wait_for(func(*args, **kwargs), timeout=timeout)
+            async with asyncio.timeout(timeout):
+                return await func(*args, **kwargs)
         return wrapper
     return decorator
 
 
+class NullLogger:
+    """Logger that discards everything, for drivers whose logs are not tested."""
+    
+    def bind(self, **kwargs: Any) -> "NullLogger":
+        return self
+    
+    def __getattr__(self, name: str) -> Callable[..., None]:
+        return _discard
+
+
+def _discard(*args: Any, **kwargs: Any) -> None:
+    pass
+
+
 class MockAsyncIterator:
     """Mock async iterator for testing."""
     
+    __slots__ = ("items", "_iterator")
+    
     def __init__(self, items: List[Any]):
         self.items = items
-        self.index = 0
+        self._iterator = iter(items)
     
     def __aiter__(self):
         return self
     
     async def __anext__(self):
-        if self.index >= len(self.items):
-            raise StopAsyncIteration
-        item = self.items[self.index]
-        self.index += 1
-        return item
+        try:
+            return next(self._iterator)
+        except StopIteration:
+            raise StopAsyncIteration from None
 
 
 class AsyncTimer:
-    """Async context manager for timing operations."""
+    """Async context manager for timing operations.
+    
+    start_time and end_time are perf_counter_ns readings, duration is in
+    seconds.
+    """
     
     def __init__(self):
-        self.start_time: Optional[float] = None
-        self.end_time: Optional[float] = None
+        self.start_time: Optional[int] = None
+        self.end_time: Optional[int] = None
         self.duration: Optional[float] = None
     
     async def __aenter__(self):
-        self.start_time = time.time()
+        self.start_time = time.perf_counter_ns()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        self.end_time = time.time()
-        self.duration = self.end_time - self.start_time
-
-
-@asynccontextmanager
-async def assert_async_raises(exception_class: type[Exception], match: Optional[str] = None):
-    """Async context manager to assert exceptions in async code.
-    
-    Args:
-        exception_class: Expected exception class
-        match: Optional string to match in exception message
-    """
-    try:
-        yield
-    except exception_class as e:
-        if match and match not in str(e):
-            raise AssertionError(f"Exception message '{e}' does not contain '{match}'")
-    else:
-        raise AssertionError(f"Expected {exception_class.__name__} but no exception was raised")
+        self.end_time = time.perf_counter_ns()
+        self.duration = (self.end_time - self.start_time) / 1e9
 
 
 class MockDriver(BaseDriver):
@@ -85,11 +135,25 @@ class MockDriver(BaseDriver):
     that can be configured for different test scenarios.
     """
     
+    __slots__ = (
+        "_name",
+        "connect_called",
+        "disconnect_called",
+        "close_call_count",
+        "search_traces_response",
+        "search_logs_response",
+        "query_metrics_response",
+        "get_service_health_response",
+        "should_fail",
+        "failure_error",
+    )
+    
     def __init__(self, config: Any, name: str = "mock"):
         super().__init__(config)
         self._name = name
         self.connect_called = False
         self.disconnect_called = False
+        self.close_call_count = 0
         self.search_traces_response = None
         self.search_logs_response = None
         self.query_metrics_response = None
@@ -111,6 +175,12 @@ class MockDriver(BaseDriver):
         if self.should_fail:
             raise self.failure_error
     
+    async def close(self) -> None:
+        self.close_call_count += 1
+        if self.should_fail:
+            raise self.failure_error
+        await super().close()
+    
     async def search_traces(self, params):
         if self.should_fail:
             raise self.failure_error
@@ -150,26 +220,57 @@ def create_mock_async_func(return_value: Any = None, side_effect: Any = None) ->
     return mock
 
 
+async def wait_for_event(event: asyncio.Event, timeout: float = 1.0) -> bool:
+    """Wait for an event to be set.
+    
+    Args:
+        event: Event set by the code under test
+        timeout: Maximum time to wait in seconds
+    
+    Returns:
+        True if the event was set, False if timeout
+    """
+    try:
+        await asyncio.wait_for(event.wait(), timeout)
+    except asyncio.TimeoutError:
+        return False
+    return True
+
+
 async def wait_for_condition(
     condition: Callable[[], bool],
     timeout: float = 1.0,
-    interval: float = 0.01
+    interval: float = 0.01,
+    event: Optional[asyncio.Event] = None
 ) -> bool:
     """Wait for a condition to become true.
     
+    Polling starts at 1ms and backs off to interval, so conditions that
+    are met quickly return without waiting a full interval.
+    
     Args:
         condition: Function that returns True when condition is met
         timeout: Maximum time to wait in seconds
-        interval: Check interval in seconds
+        interval: Longest pause between checks in seconds
+        event: Event set when the condition may have changed; if given,
+            it is awaited instead of polling
         
     Returns:
         True if condition was met, False if timeout
     """
-    start_time = time.time()
-    while time.time() - start_time < timeout:
+    if condition():
+        return True
+    if event is not None:
+        return await wait_for_event(event, timeout) and condition()
+    
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    delay = min(0.001, interval)
+    while loop.time() < deadline:
+        await asyncio.sleep(delay)
         if condition():
             return True
-        await asyncio.sleep(interval)
+        delay = min(delay * 1.5, interval)
     return False
 
 
@@ -180,13 +281,25 @@ class AsyncBatchProcessor:
         self.batch_size = batch_size
         self.processed_items: List[Any] = []
     
-    async def process_batch(self, items: List[Any]) -> List[Any]:
-        """Process a batch of items."""
+    async def process_batch(self, items: List[Any], delay: float = 0.0) -> List[Any]:
+        """Process a batch of items.
+        
+        Args:
+            items: Items to process
+            delay: Simulated processing time per chunk of batch_size items
+            
+        Returns:
+            The processed items, in order
+        """
+        if delay <= 0:
+            # Chunking is not observable without a delay, process all at once
+            self.processed_items.extend(items)
+            return list(items)
+        
         results = []
         for i in range(0, len(items), self.batch_size):
             batch = items[i:i + self.batch_size]
-            # Simulate async processing
-            await asyncio.sleep(0.01)
+            await asyncio.sleep(delay)
             results.extend(batch)
             self.processed_items.extend(batch)
         return results
@@ -224,51 +337,70 @@ class ConcurrentTestHelper:
         self.active_tasks = 0
         self.max_concurrent = 0
         self.completed_tasks = 0
-        self._lock = asyncio.Lock()
     
     async def track_task(self, coro):
         """Track concurrent execution of a coroutine."""
-        async with self._lock:
-            self.active_tasks += 1
-            self.max_concurrent = max(self.max_concurrent, self.active_tasks)
+        # No lock needed: the counters are only updated between awaits on
+        # the single event loop thread
+        self.active_tasks += 1
+        self.max_concurrent = max(self.max_concurrent, self.active_tasks)
         
         try:
             result = await coro
             return result
         finally:
-            async with self._lock:
-                self.active_tasks -= 1
-                self.completed_tasks += 1
+            self.active_tasks -= 1
+            self.completed_tasks += 1
     
     async def run_concurrent(self, coros: List) -> List[Any]:
         """Run multiple coroutines concurrently and track execution."""
-        tasks = [self.track_task(coro) for coro in coros]
-        return await asyncio.gather(*tasks)
+        if not hasattr(asyncio, "TaskGroup"):  # Python < 3.11
+            return await asyncio.gather(*(self.track_task(coro) for coro in coros))
+        
+        results: List[Any] = [None] * len(coros)
+        async with asyncio.TaskGroup() as group:
+            for index, coro in enumerate(coros):
+                group.create_task(self._store(index, coro, results))
+        return results
+    
+    async def _store(self, index: int, coro, results: List[Any]) -> None:
+        """Track a coroutine and store its result at the given index."""
+        results[index] = await self.track_task(coro)
 
 
 # Test data validation helpers
+_TRACE_ATTRS = frozenset({"trace_id", "spans", "start_time", "end_time", "duration_ms"})
+_LOG_ATTRS = frozenset({"timestamp", "level", "message", "service_name"})
+_METRIC_ATTRS = frozenset({"name", "type", "service_name", "data_points"})
+
+
+def _missing_attrs(obj: Any, attrs: frozenset) -> frozenset:
+    """Return the attributes in attrs that obj does not have.
+    
+    Checked on the instance, since models built with model_construct can
+    lack required fields.
+    """
+    if isinstance(obj, BaseModel):
+        # Set fields live in the instance __dict__, one set difference
+        return attrs - vars(obj).keys()
+    return frozenset(name for name in attrs if not hasattr(obj, name))
+
+
 def assert_valid_trace(trace: Any) -> None:
     """Assert that a trace object is valid."""
-    assert hasattr(trace, "trace_id")
-    assert hasattr(trace, "spans")
+    missing = _missing_attrs(trace, _TRACE_ATTRS)
+    assert not missing, f"Trace is missing {sorted(missing)}"
     assert len(trace.spans) > 0
-    assert hasattr(trace, "start_time")
-    assert hasattr(trace, "end_time")
-    assert hasattr(trace, "duration_ms")
 
 
 def assert_valid_log(log: Any) -> None:
     """Assert that a log object is valid."""
-    assert hasattr(log, "timestamp")
-    assert hasattr(log, "level")
-    assert hasattr(log, "message")
-    assert hasattr(log, "service_name")
+    missing = _missing_attrs(log, _LOG_ATTRS)
+    assert not missing, f"Log is missing {sorted(missing)}"
 
 
 def assert_valid_metric(metric: Any) -> None:
     """Assert that a metric object is valid."""
-    assert hasattr(metric, "name")
-    assert hasattr(metric, "type")
-    assert hasattr(metric, "service_name")
-    assert hasattr(metric, "data_points")
-    assert len(metric.data_points) > 0 
\ No newline at end of file
+    missing = _missing_attrs(metric, _METRIC_ATTRS)
+    assert not missing, f"Metric is missing {sorted(missing)}"
+    assert len(metric.data_points) > 0